@@ -56,3 +56,15 @@ async def get_api_key_info(request: Request) -> Dict[str, Any]:
         )
     
     return app_info
+
+async def require_active_app(request: Request) -> Dict[str, Any]:
+    """
+    Dependência de autenticação para as rotas protegidas.
+    Reaproveita o app_info já resolvido pelo APIKeyAuthMiddleware (request.state.app_info);
+    se a rota for usada sem o middleware, valida a API Key diretamente (401 em caso de falha).
+    Assim os serviços recebem sempre um app_info autenticado e ativo.
+    """
+    app_info = getattr(request.state, 'app_info', None)
+    if app_info and app_info.get("is_active"):
+        return app_info
+    return await get_api_key_info(request)
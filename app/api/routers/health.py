@@ -45,7 +45,7 @@ async def health_check(request: Request) -> HealthCheckResponse:
                 logger.debug("Health Check: Conexão com DB OK.")
             except Exception as e:
                 db_status = False
-                logger.error(f"Health Check: Falha na query de verificação do DB: {e}", exc_info=True)
+                logger.error("Health Check: Falha na query de verificação do DB: %s", e, exc_info=True)
                 if log_repo:
                     await log_repo.add_log_entry(
                         LogEntry(
@@ -120,7 +120,7 @@ async def health_check(request: Request) -> HealthCheckResponse:
             }
         )
     except Exception as e:
-        logger.critical(f"Erro fatal durante a verificação de saúde: {e}", exc_info=True)
+        logger.critical("Erro fatal durante a verificação de saúde: %s", e, exc_info=True)
         if log_repo:
             # Tenta logar o erro fatal no LogRepository
             # Se o log_repo em si estiver com problemas, esta parte pode falhar.
@@ -136,7 +136,7 @@ async def health_check(request: Request) -> HealthCheckResponse:
                     )
                 )
             except Exception as log_exc:
-                logger.error(f"Falha ao registrar log de erro fatal no LogRepository: {log_exc}", exc_info=True)
+                logger.error("Falha ao registrar log de erro fatal no LogRepository: %s", log_exc, exc_info=True)
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,7 +1,10 @@
 import logging
 from typing import Dict, Any, List, Optional, Union # Adicionada Union
-from fastapi import APIRouter, Request, Depends, HTTPException, status
+from fastapi import APIRouter, Request, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from app.services.validation_service import ValidationService
+from app.api.dependencies import require_active_app
 from app.api.schemas.common import UniversalValidationRequest, ValidationResponse, HistoryRecordResponse
 from app.models.validation_record import ValidationRecord
 import uuid
@@ -10,27 +13,34 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Serializador da lista de respostas de validação: os modelos já chegam construídos pelo serviço,
+# então são convertidos para JSON diretamente, sem a revalidação do response_model.
+_validation_response_list = TypeAdapter(List[ValidationResponse])
+_history_record_list = TypeAdapter(List[HistoryRecordResponse])
+
+# Limites do GET /records: até RECORDS_STREAM_THRESHOLD registros a lista é montada em memória
+# (erros viram 500); acima disso é transmitida por cursor, até no máximo RECORDS_MAX_LIMIT registros.
+RECORDS_STREAM_THRESHOLD = 100
+RECORDS_MAX_LIMIT = 5000
+
 # Dependência para o ValidationService
 async def get_validation_service(request: Request) -> ValidationService:
     """Retorna a instância do ValidationService do estado da aplicação."""
     return request.app.state.validation_service
 
-# Dependência para as informações da API Key
-async def get_api_key_info(request: Request) -> Dict[str, Any]:
-    """Retorna as informações da API Key do estado da requisição."""
-    return request.state.app_info
-
 @router.post("/validate",
-             response_model=List[ValidationResponse], # O modelo de resposta agora é uma lista de ValidationResponse
+             # Sem response_model: a lista é serializada uma única vez no próprio endpoint.
+             # 'responses' mantém o schema de ValidationResponse na documentação OpenAPI.
+             responses={status.HTTP_200_OK: {"model": List[ValidationResponse]}},
              status_code=status.HTTP_200_OK,
              summary="Validar e Persistir Dados Diversos (Lote ou Único)",
              tags=["Validação"])
 async def validate_data_endpoint(
     # Aceita tanto um único objeto UniversalValidationRequest quanto uma lista deles
     request_data: Union[UniversalValidationRequest, List[UniversalValidationRequest]],
-    api_key_info: Dict[str, Any] = Depends(get_api_key_info),
+    api_key_info: Dict[str, Any] = Depends(require_active_app),
     validation_service: ValidationService = Depends(get_validation_service)
-) -> List[ValidationResponse]: # O tipo de retorno da função agora é List[ValidationResponse]
+) -> Response:
     """
     Endpoint principal para validação de dados. Recebe um tipo de validação e um payload de dados.
     Suporta o envio de um único objeto ou uma lista de objetos para validação em lote.
@@ -48,7 +58,7 @@ async def validate_data_endpoint(
     results: List[ValidationResponse] = []
     
     for item_data in request_data_list:
-        logger.info(f"Processando validação para tipo: {item_data.validation_type}")
+        logger.info("Processando validação para tipo: %s", item_data.validation_type)
         # O ValidationService.validate_data espera um único UniversalValidationRequest
         service_response = await validation_service.validate_data(api_key_info, item_data)
 
@@ -56,49 +66,62 @@ async def validate_data_endpoint(
         # indicando falhas individualmente, em vez de levantar HTTPException no primeiro erro.
         # No entanto, para manter o comportamento anterior de "falha total" em caso de erro HTTP
         # de um item, mantemos a lógica de levantar HTTPException.
-        if service_response.get("status_code", 200) >= 400:
+        # Em caso de sucesso o serviço devolve o próprio ValidationResponse; erros chegam como dicionário.
+        if isinstance(service_response, dict) and service_response.get("status_code", 200) >= 400:
             raise HTTPException(
                 status_code=service_response.get("status_code", status.HTTP_500_INTERNAL_SERVER_ERROR),
                 detail=service_response.get("message", "Erro desconhecido durante a validação de um item.")
             )
         
-        # Adiciona o dicionário de resposta do serviço à lista de resultados.
-        # FastAPI se encarregará de converter para ValidationResponse.
+        # Adiciona o ValidationResponse à lista de resultados, sem conversão intermediária para dicionário.
         results.append(service_response)
 
-    # Retorna a lista de resultados. FastAPI a converterá para List[ValidationResponse].
-    return results
+    # Retorna a lista de resultados já serializada em JSON.
+    return Response(content=_validation_response_list.dump_json(results), media_type="application/json")
 
 
 @router.get("/records",
-             response_model=List[HistoryRecordResponse],
+             responses={status.HTTP_200_OK: {"model": List[HistoryRecordResponse]}},
              summary="Obter Histórico de Validações",
              tags=["Histórico"])
 async def get_records(
-    api_key_info: Dict[str, Any] = Depends(get_api_key_info),
+    api_key_info: Dict[str, Any] = Depends(require_active_app),
     validation_service: ValidationService = Depends(get_validation_service),
-    limit: int = 10,
+    limit: int = Query(10, ge=1, le=RECORDS_MAX_LIMIT, description="Número máximo de registros a serem retornados."),
     include_deleted: bool = False
-) -> List[HistoryRecordResponse]:
+) -> Response:
     """
     Retorna o histórico de validações para a aplicação associada à API Key.
     Suporta paginação e filtragem de registros deletados.
+
+    Até RECORDS_STREAM_THRESHOLD registros (inclui o limite padrão) a lista é lida de uma vez,
+    e uma falha no banco resulta em erro HTTP. Acima disso o array JSON é transmitido registro a registro
+    a partir de um cursor: a resposta já começou com status 200, então uma falha no meio do envio
+    interrompe a conexão (o cliente recebe um corpo incompleto, nunca um JSON truncado "válido").
+    Durante o envio, uma conexão do pool e uma transação ficam ocupadas até o cliente terminar de ler;
+    RECORDS_MAX_LIMIT limita esse tempo.
     """
-    logger.info(f"Requisição GET /api/v1/records recebida para app: {api_key_info.get('app_name')}")
-    
-    service_response = await validation_service.get_validation_history(
-        api_key_str=api_key_info.get('api_key_string'), # Passa a string da API Key, que o service vai usar internamente para lookup
+    logger.info("Requisição GET /api/v1/records recebida para app: %s", api_key_info.get('app_name'))
+
+    if limit <= RECORDS_STREAM_THRESHOLD:
+        service_response = await validation_service.get_validation_history(
+            app_info=api_key_info, # app_info já autenticado pela dependência require_active_app
+            limit=limit,
+            include_deleted=include_deleted
+        )
+        if service_response.get("status_code", 200) >= 400:
+            raise HTTPException(
+                status_code=service_response.get("status_code", status.HTTP_500_INTERNAL_SERVER_ERROR),
+                detail=service_response.get("message", "Erro desconhecido ao obter histórico.")
+            )
+        return Response(content=_history_record_list.dump_json(service_response["history"]), media_type="application/json")
+
+    history_stream = validation_service.stream_validation_history(
+        app_info=api_key_info, # app_info já autenticado pela dependência require_active_app
         limit=limit,
         include_deleted=include_deleted
     )
-
-    if service_response.get("status_code", 200) >= 400:
-        raise HTTPException(
-            status_code=service_response.get("status_code", status.HTTP_500_INTERNAL_SERVER_ERROR),
-            detail=service_response.get("message", "Erro desconhecido ao obter histórico.")
-        )
-    
-    return service_response.get("history", [])
+    return StreamingResponse(history_stream, media_type="application/json")
 
 
 @router.patch("/records/{record_id}/soft-delete",
@@ -106,19 +129,19 @@ async def get_records(
               tags=["Ações do Registro"])
 async def soft_delete_record(
     record_id: uuid.UUID,
-    api_key_info: Dict[str, Any] = Depends(get_api_key_info),
+    api_key_info: Dict[str, Any] = Depends(require_active_app),
     validation_service: ValidationService = Depends(get_validation_service)
 ) -> Dict[str, str]:
     """
     Marca um registro de validação como 'soft-deletado' (exclusão lógica).
     Requer permissão específica da API Key.
     """
-    logger.info(f"Requisição PATCH /api/v1/records/{record_id}/soft-delete recebida.")
+    logger.info("Requisição PATCH /api/v1/records/%s/soft-delete recebida.", record_id)
     
     # A validação de permissão 'can_delete_records' já ocorre no middleware APIKeyAuthMiddleware
     # Se a requisição chegou aqui, a permissão já foi verificada.
     service_response = await validation_service.soft_delete_record(
-        api_key_str=api_key_info.get('api_key_string'), # Passa a string da API Key
+        app_info=api_key_info, # app_info já autenticado pela dependência require_active_app
         record_id=record_id
     )
 
@@ -136,18 +159,18 @@ async def soft_delete_record(
               tags=["Ações do Registro"])
 async def restore_record(
     record_id: uuid.UUID,
-    api_key_info: Dict[str, Any] = Depends(get_api_key_info),
+    api_key_info: Dict[str, Any] = Depends(require_active_app),
     validation_service: ValidationService = Depends(get_validation_service)
 ) -> Dict[str, str]:
     """
     Restaura um registro de validação que foi previamente soft-deletado.
     Requer permissão específica da API Key.
     """
-    logger.info(f"Requisição PATCH /api/v1/records/{record_id}/restore recebida.")
+    logger.info("Requisição PATCH /api/v1/records/%s/restore recebida.", record_id)
 
     # A validação de permissão 'can_delete_records' já ocorre no middleware APIKeyAuthMiddleware
     service_response = await validation_service.restore_record(
-        api_key_str=api_key_info.get('api_key_string'), # Passa a string da API Key
+        app_info=api_key_info, # app_info já autenticado pela dependência require_active_app
         record_id=record_id
     )
 
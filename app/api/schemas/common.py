@@ -108,6 +108,7 @@ class UniversalValidationRequest(BaseModel):
     ] = Field(..., description="O payload de dados para a validação específica.")
     client_identifier: Optional[str] = Field(None, description="Identificador do cliente ou sistema que está enviando a requisição.")
     operator_id: Optional[str] = Field(None, description="Identificador do operador ou usuário que iniciou a ação.")
+    cache_bypass: bool = Field(False, description="Se True, ignora o cache de resultados e executa o validador novamente.")
 
 # --- Schemas de Resposta (Output Models) ---
 
@@ -25,9 +25,9 @@ class APIKeyManager:
         """
         Carrega as chaves de API do arquivo JSON especificado.
         """
-        logger.info(f"Tentando carregar API Keys do arquivo: {self.api_keys_file}")
+        logger.info("Tentando carregar API Keys do arquivo: %s", self.api_keys_file)
         if not os.path.exists(self.api_keys_file):
-            logger.error(f"Arquivo de API Keys não encontrado: {self.api_keys_file}")
+            logger.error("Arquivo de API Keys não encontrado: %s", self.api_keys_file)
             self._api_keys = {} # Garante que _api_keys está vazio se o arquivo não for encontrado
             return
 
@@ -35,21 +35,21 @@ class APIKeyManager:
             with open(self.api_keys_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
                 if not isinstance(data, dict):
-                    logger.error(f"Conteúdo do arquivo {self.api_keys_file} não é um dicionário JSON válido.")
+                    logger.error("Conteúdo do arquivo %s não é um dicionário JSON válido.", self.api_keys_file)
                     self._api_keys = {}
                     return
 
                 self._api_keys = data
-                logger.info(f"API Keys carregadas com sucesso do arquivo: {len(self._api_keys)} chaves.")
+                logger.info("API Keys carregadas com sucesso do arquivo: %s chaves.", len(self._api_keys))
                 # NOVO LOG: Mostra as chaves carregadas (apenas os nomes das chaves para segurança)
                 for key, details in self._api_keys.items():
-                    logger.debug(f"Carregada chave: '{key}' com detalhes: {details.get('app_name', 'N/A')}, is_active: {details.get('is_active', False)}")
+                    logger.debug("Carregada chave: '%s' com detalhes: %s, is_active: %s", key, details.get('app_name', 'N/A'), details.get('is_active', False))
 
         except json.JSONDecodeError as e:
-            logger.error(f"Erro ao decodificar JSON do arquivo {self.api_keys_file}: {e}")
+            logger.error("Erro ao decodificar JSON do arquivo %s: %s", self.api_keys_file, e)
             self._api_keys = {}
         except Exception as e:
-            logger.error(f"Erro inesperado ao carregar API Keys do arquivo {self.api_keys_file}: {e}")
+            logger.error("Erro inesperado ao carregar API Keys do arquivo %s: %s", self.api_keys_file, e)
             self._api_keys = {}
 
     def get_app_info(self, api_key: str) -> Optional[Dict[str, Any]]:
@@ -62,14 +62,16 @@ class APIKeyManager:
                                       (app_name, permissões, etc.) ou None se a chave for inválida.
         """
         # NOVO LOG: Mostra a API Key que está sendo procurada (primeiros caracteres)
-        logger.debug(f"Procurando por API Key: '{api_key[:8]}...'")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Procurando por API Key: '%s...'", api_key[:8])
 
         app_info = self._api_keys.get(api_key)
         
         if app_info and app_info.get("is_active"):
-            logger.info(f"API Key '{api_key[:8]}...' (App: {app_info.get('app_name', 'Desconhecido')}) encontrada e ativa.")
+            if logger.isEnabledFor(logging.INFO): # Evita extrair o prefixo da chave quando o nível está filtrado
+                logger.info("API Key '%s...' (App: %s) encontrada e ativa.", api_key[:8], app_info.get('app_name', 'Desconhecido'))
             return app_info
         
-        logger.warning(f"API Key '{api_key[:8]}...' não encontrada ou inválida.")
+        logger.warning("API Key '%s...' não encontrada ou inválida.", api_key[:8])
         return None
 
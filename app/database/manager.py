@@ -1,12 +1,54 @@
 # app/database/manager.py
 import asyncpg
 import logging
-from typing import Optional, ContextManager
+import contextvars
+import orjson # Codec JSON/JSONB das conexões (mais rápido que o json da stdlib)
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, ContextManager
 
 # Configuração de logging específica para este módulo
 # Isso permite um controle mais granular dos logs do DatabaseManager
 logger = logging.getLogger(__name__)
 
+# Conexão vinculada ao contexto assíncrono atual (ver DatabaseManager.shared_connection).
+# Enquanto estiver definida, get_connection() reutiliza essa conexão em vez de adquirir outra do pool.
+_bound_connection: contextvars.ContextVar[Optional[asyncpg.Connection]] = contextvars.ContextVar(
+    "db_bound_connection", default=None
+)
+
+def _encode_json(value) -> str:
+    """Serializa um objeto Python para o formato texto de JSON/JSONB do PostgreSQL."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """
+    Executado pelo pool uma única vez para cada nova conexão.
+    Registra codecs de JSON/JSONB com orjson: os repositórios passam e recebem dicts Python
+    diretamente, sem json.dumps/json.loads manuais (um único passo de serialização).
+    """
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name,
+            encoder=_encode_json,
+            decoder=orjson.loads,
+            schema="pg_catalog",
+            format="text"
+        )
+
+class _ReusedConnection:
+    """
+    Gerenciador de contexto que entrega uma conexão já adquirida sem liberá-la ao sair.
+    A liberação fica a cargo de quem a adquiriu (shared_connection).
+    """
+    def __init__(self, conn: asyncpg.Connection):
+        self._conn = conn
+
+    async def __aenter__(self) -> asyncpg.Connection:
+        return self._conn
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
 class DatabaseManager:
     """
     Classe Singleton para gerenciar o pool de conexões com o banco de dados PostgreSQL.
@@ -95,8 +137,13 @@ class DatabaseManager:
                 max_size=20,       # Número máximo de conexões no pool
                 timeout=60,        # Tempo máximo em segundos para esperar por uma conexão do pool
                 max_queries=50000, # Fechar e reabrir uma conexão após 50k consultas (para evitar vazamentos)
+                # Cache de prepared statements por conexão: as mesmas consultas dos repositórios
+                # (create_record, get_record_by_id, soft_delete_record...) são reaproveitadas sem novo parse/plan.
+                statement_cache_size=1024,
+                max_cached_statement_lifetime=0, # 0 = statements em cache não expiram por tempo
+                init=_init_connection, # Codecs JSON/JSONB com orjson em cada nova conexão
                 # command_timeout=30 # Tempo limite para cada comando SQL
-                loop=None          # Usa o loop de eventos padrão (asyncio.get_event_loop())
+                # Sem 'loop': o pool usa o loop em execução (connect() é sempre chamado dentro do lifespan)
             )
             self.logger.info("DatabaseManager: Pool de conexões asyncpg criado com sucesso.")
         except asyncpg.exceptions.InvalidCatalogNameError:
@@ -143,6 +190,11 @@ class DatabaseManager:
             async with db_manager.get_connection() as conn:
                 result = await conn.fetch("SELECT 1")
         """
+        # Dentro de um bloco shared_connection(), reutiliza a conexão já adquirida
+        bound_conn = _bound_connection.get()
+        if bound_conn is not None:
+            return _ReusedConnection(bound_conn)
+
         if not self.is_connected:
             self.logger.error("DatabaseManager: Tentativa de obter conexão sem um pool ativo. Verifique o ciclo de vida da aplicação.")
             raise ConnectionError("O pool de conexões não está inicializado ou foi fechado. Chame 'connect()' primeiro.")
@@ -150,6 +202,33 @@ class DatabaseManager:
         # asyncpg.Pool.acquire() é um gerenciador de contexto assíncrono
         return self._pool.acquire()
 
+    @asynccontextmanager
+    async def shared_connection(self) -> AsyncIterator[asyncpg.Connection]:
+        """
+        Adquire uma única conexão do pool e a compartilha com todas as chamadas a get_connection()
+        feitas dentro do bloco (no mesmo contexto assíncrono), inclusive por repositórios diferentes.
+        Útil quando uma requisição executa várias consultas em sequência: um único acquire/release.
+
+        As consultas dentro do bloco devem ser sequenciais (uma conexão asyncpg não executa
+        consultas concorrentes). Blocos aninhados reutilizam a conexão externa.
+
+        Exemplo de uso:
+            async with db_manager.shared_connection():
+                record = await repo.create_record(record)
+                await decision_rules.apply_rules(record, app_info)
+        """
+        bound_conn = _bound_connection.get()
+        if bound_conn is not None:
+            yield bound_conn
+            return
+
+        async with self.get_connection() as conn:
+            token = _bound_connection.set(conn)
+            try:
+                yield conn
+            finally:
+                _bound_connection.reset(token)
+
     @property
     def is_connected(self) -> bool:
         """
@@ -38,20 +38,21 @@ class ClientEntityPostgresRepository:
             else:
                 entity_data[uuid_field] = None # Garante None se for None no DB
 
-        # Convertendo JSONB de asyncpg.Record (pode ser dict ou str) para dict Python
-        # Para 'contributing_apps', se for string (vindo do DB), decodifica. Se for None, default para dict vazio.
+        # Convertendo JSONB de asyncpg.Record para dict Python
+        # O codec JSONB do pool já entrega 'contributing_apps' como dict (com timestamps em string ISO).
+        # Se for None, default para dict vazio.
         if 'contributing_apps' in entity_data:
             apps_data = entity_data['contributing_apps']
-            if isinstance(apps_data, str):
+            if isinstance(apps_data, dict):
                 try:
                     # Converte timestamps string de volta para datetime
-                    parsed_apps = json.loads(apps_data)
+                    parsed_apps = dict(apps_data)
                     for app_name, timestamp_str in parsed_apps.items():
                         if isinstance(timestamp_str, str):
                             parsed_apps[app_name] = datetime.fromisoformat(timestamp_str).replace(tzinfo=timezone.utc)
                     entity_data['contributing_apps'] = parsed_apps
-                except (json.JSONDecodeError, ValueError):
-                    logger.warning(f"Erro ao decodificar contributing_apps para ClientEntity ID {entity_id_for_log}. Definindo como vazio.")
+                except ValueError:
+                    logger.warning("Erro ao decodificar contributing_apps para ClientEntity ID %s. Definindo como vazio.", entity_id_for_log)
                     entity_data['contributing_apps'] = {}
             elif apps_data is None:
                 entity_data['contributing_apps'] = {}
@@ -65,7 +66,7 @@ class ClientEntityPostgresRepository:
         try:
             return ClientEntity(**entity_data)
         except Exception as pydantic_e:
-            logger.error(f"Erro ao instanciar ClientEntity para ID {entity_id_for_log}: {pydantic_e}. Dados: {entity_data}", exc_info=True)
+            logger.error("Erro ao instanciar ClientEntity para ID %s: %s. Dados: %s", entity_id_for_log, pydantic_e, entity_data, exc_info=True)
             return None
 
     async def get_by_id(self, entity_id: uuid.UUID) -> Optional[ClientEntity]:
@@ -83,10 +84,10 @@ class ClientEntityPostgresRepository:
                 row = await conn.fetchrow(query_sql, entity_id)
                 return self._row_to_client_entity(row)
         except asyncpg.exceptions.PostgresError as e:
-            logger.error(f"Erro ao buscar ClientEntity pelo ID '{entity_id}' no DB: {e}", exc_info=True)
+            logger.error("Erro ao buscar ClientEntity pelo ID '%s' no DB: %s", entity_id, e, exc_info=True)
             return None
         except Exception as e:
-            logger.error(f"Erro inesperado ao buscar ClientEntity pelo ID '{entity_id}': {e}", exc_info=True)
+            logger.error("Erro inesperado ao buscar ClientEntity pelo ID '%s': %s", entity_id, e, exc_info=True)
             return None
 
     async def get_by_document_and_cclub(self, document_normalized: str, cclub: Optional[str]) -> Optional[ClientEntity]:
@@ -110,10 +111,10 @@ class ClientEntityPostgresRepository:
                 row = await conn.fetchrow(query_sql, document_normalized, cclub)
                 return self._row_to_client_entity(row)
         except asyncpg.exceptions.PostgresError as e:
-            logger.error(f"Erro ao buscar ClientEntity por documento '{document_normalized}' e CCLUB '{cclub}' no DB: {e}", exc_info=True)
+            logger.error("Erro ao buscar ClientEntity por documento '%s' e CCLUB '%s' no DB: %s", document_normalized, cclub, e, exc_info=True)
             return None
         except Exception as e:
-            logger.error(f"Erro inesperado ao buscar ClientEntity por documento '{document_normalized}' e CCLUB '{cclub}': {e}", exc_info=True)
+            logger.error("Erro inesperado ao buscar ClientEntity por documento '%s' e CCLUB '%s': %s", document_normalized, cclub, e, exc_info=True)
             return None
 
     async def save(self, client_entity: ClientEntity) -> ClientEntity:
@@ -121,10 +122,10 @@ class ClientEntityPostgresRepository:
         Salva ou atualiza uma ClientEntity no PostgreSQL.
         Usa INSERT ... ON CONFLICT (id) DO UPDATE para lidar com upsert.
         """
-        # Serializa o contributing_apps para JSON string, com tratamento para datetimes
-        contributing_apps_json = json.dumps({
+        # Monta o contributing_apps (dict) com datetimes em ISO; o codec JSONB do pool serializa
+        contributing_apps_json = {
             app: dt.isoformat() for app, dt in client_entity.contributing_apps.items()
-        }) if client_entity.contributing_apps else '{}'
+        } if client_entity.contributing_apps else {}
 
         insert_sql = """
         INSERT INTO client_entities (
@@ -172,11 +173,11 @@ class ClientEntityPostgresRepository:
                     client_entity.id = str(row['id'])
                     client_entity.created_at = row['created_at']
                     client_entity.updated_at = row['updated_at']
-                    logger.info(f"ClientEntity salva/atualizada com sucesso no DB. ID: {client_entity.id}")
+                    logger.info("ClientEntity salva/atualizada com sucesso no DB. ID: %s", client_entity.id)
                     return client_entity
                 return None
         except asyncpg.exceptions.UniqueViolationError as e:
-            logger.error(f"Erro de violação de unicidade ao salvar ClientEntity: {e}", exc_info=True)
+            logger.error("Erro de violação de unicidade ao salvar ClientEntity: %s", e, exc_info=True)
             # Isso ocorreria se houvesse uma restrição UNIQUE em (main_document_normalized, cclub)
             # e a inserção tentasse criar uma duplicata com um ID diferente.
             # O ON CONFLICT (id) trata apenas conflitos de PK.
@@ -184,10 +185,10 @@ class ClientEntityPostgresRepository:
             # (ex: verificar duplicidade antes do save, ou usar ON CONFLICT na coluna de negócio)
             raise # Re-lançar para o serviço lidar com a duplicidade de negócio
         except asyncpg.exceptions.PostgresError as e:
-            logger.error(f"Erro ao salvar ClientEntity no DB: {e}", exc_info=True)
+            logger.error("Erro ao salvar ClientEntity no DB: %s", e, exc_info=True)
             return None
         except Exception as e:
-            logger.error(f"Erro inesperado ao salvar ClientEntity: {e}", exc_info=True)
+            logger.error("Erro inesperado ao salvar ClientEntity: %s", e, exc_info=True)
             return None
 
     async def delete(self, entity_id: uuid.UUID) -> bool:
@@ -201,15 +202,15 @@ class ClientEntityPostgresRepository:
             async with self.db_manager.get_connection() as conn:
                 row = await conn.fetchrow(delete_sql, entity_id)
                 if row:
-                    logger.info(f"ClientEntity {entity_id} deletada com sucesso do DB.")
+                    logger.info("ClientEntity %s deletada com sucesso do DB.", entity_id)
                     return True
-                logger.warning(f"Tentativa de deletar ClientEntity inexistente no DB: {entity_id}")
+                logger.warning("Tentativa de deletar ClientEntity inexistente no DB: %s", entity_id)
                 return False
         except asyncpg.exceptions.PostgresError as e:
-            logger.error(f"Erro ao deletar ClientEntity {entity_id} no DB: {e}", exc_info=True)
+            logger.error("Erro ao deletar ClientEntity %s no DB: %s", entity_id, e, exc_info=True)
             return False
         except Exception as e:
-            logger.error(f"Erro inesperado ao deletar ClientEntity {entity_id}: {e}", exc_info=True)
+            logger.error("Erro inesperado ao deletar ClientEntity %s: %s", entity_id, e, exc_info=True)
             return False
 
 # SQL para a criação da tabela client_entities (para referência)
@@ -244,4 +245,3 @@ CREATE INDEX IF NOT EXISTS idx_client_entities_doc_cclub ON client_entities (mai
 -- CREATE UNIQUE INDEX idx_unique_main_document_cclub_null_only_one ON client_entities (main_document_normalized) WHERE cclub IS NULL;
 -- CREATE UNIQUE INDEX idx_unique_main_document_cclub_not_null ON client_entities (main_document_normalized, cclub) WHERE cclub IS NOT NULL;
 """
-import json # Importa json para serializar/deserializar JSONB
\ No newline at end of file
@@ -20,7 +20,7 @@ class ClientEntityRepository:
 
     async def get_by_id(self, entity_id: uuid.UUID) -> Optional[ClientEntity]: # Tipado como uuid.UUID
         """Busca uma ClientEntity pelo seu ID (UUID)."""
-        logger.debug(f"Buscando ClientEntity pelo ID: {entity_id}")
+        logger.debug("Buscando ClientEntity pelo ID: %s", entity_id)
         # Converte o UUID para string para buscar no dicionário
         return self._client_entities.get(str(entity_id))
 
@@ -29,7 +29,7 @@ class ClientEntityRepository:
         Busca uma ClientEntity pelo CPF/CNPJ principal normalizado e CCLUB em memória.
         Esta seria a lógica principal para identificar um cliente existente no contexto do barramento.
         """
-        logger.debug(f"Buscando ClientEntity por documento '{document_normalized}' e CCLUB '{cclub}'")
+        logger.debug("Buscando ClientEntity por documento '%s' e CCLUB '%s'", document_normalized, cclub)
         for entity in self._client_entities.values():
             if entity.main_document_normalized == document_normalized and (entity.cclub == cclub or (entity.cclub is None and cclub is None)):
                 return entity
@@ -37,7 +37,7 @@ class ClientEntityRepository:
 
     async def save(self, client_entity: ClientEntity) -> ClientEntity:
         """Salva ou atualiza uma ClientEntity em memória."""
-        logger.debug(f"Salvando/Atualizando ClientEntity com ID: {client_entity.id}")
+        logger.debug("Salvando/Atualizando ClientEntity com ID: %s", client_entity.id)
         
         # Garante que created_at seja definido apenas na criação (em memória)
         # Em um DB real, o default da coluna cuida disso.
@@ -54,13 +54,13 @@ class ClientEntityRepository:
 
     async def delete(self, entity_id: uuid.UUID) -> bool: # Tipado como uuid.UUID
         """Deleta uma ClientEntity pelo seu ID (UUID) em memória."""
-        logger.debug(f"Deletando ClientEntity com ID: {entity_id}")
+        logger.debug("Deletando ClientEntity com ID: %s", entity_id)
         entity_id_str = str(entity_id) # Converte para string para buscar no dicionário
         if entity_id_str in self._client_entities:
             del self._client_entities[entity_id_str]
-            logger.info(f"ClientEntity {entity_id} deletada em memória com sucesso.")
+            logger.info("ClientEntity %s deletada em memória com sucesso.", entity_id)
             return True
-        logger.warning(f"Tentativa de deletar ClientEntity inexistente em memória: {entity_id}")
+        logger.warning("Tentativa de deletar ClientEntity inexistente em memória: %s", entity_id)
         return False
     async def list_all(self) -> List[ClientEntity]:
         """Lista todas as ClientEntities armazenadas em memória."""
@@ -2,10 +2,10 @@
 
 import logging
 import asyncpg
+import uuid
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime, timezone
-import json # Importar a biblioteca json
 
 # Importe LogEntry do local correto (app.models)
 from app.models.log_entry import LogEntry
@@ -48,7 +48,7 @@ class LogRepository:
             log_entry.usuario_operador,
             log_entry.related_record_id,
             log_entry.client_entity_id_afetado, # Novo campo
-            json.dumps(log_entry.detalhes_evento_json), # Serializa para JSON string
+            log_entry.detalhes_evento_json, # dict: serializado pelo codec JSONB do pool
             log_entry.status_operacao,
             log_entry.mensagem_log,
             log_entry.created_at
@@ -59,10 +59,6 @@ class LogRepository:
                 row = await conn.fetchrow(insert_sql, *params)
                 if row:
                     row_as_dict = dict(row)
-                    # Certifica-se de que JSONB é carregado de volta para dict
-                    if isinstance(row_as_dict.get('detalhes_evento_json'), str):
-                        row_as_dict['detalhes_evento_json'] = json.loads(row_as_dict['detalhes_evento_json'])
-                    
                     # CORRIGIDO: Mapeia timestamp_evento do DB para o campo timestamp_evento do modelo
                     # Renomeia 'timestamp_evento' do DB para 'timestamp_evento' no modelo Pydantic
                     # já que LogEntry espera 'timestamp_evento' (pelo que definimos no modelo)
@@ -72,9 +68,50 @@ class LogRepository:
                     return LogEntry.model_validate(row_as_dict)
                 return None
         except Exception as e:
-            logger.error(f"Erro inesperado ao adicionar log: {e}", exc_info=True)
+            logger.error("Erro inesperado ao adicionar log: %s", e, exc_info=True)
             return None
 
+    async def add_log_entries_bulk(self, log_entries: List[LogEntry]) -> int:
+        """
+        Adiciona vários registros de log de auditoria em uma única ida ao banco (executemany).
+        Retorna a quantidade de registros gravados, ou 0 em caso de erro (nenhum registro do lote é gravado).
+        """
+        if not log_entries:
+            return 0
+
+        insert_sql = """
+            INSERT INTO audit_logs (
+                id, timestamp_evento, tipo_evento, app_origem, usuario_operador,
+                record_id_afetado, client_entity_id_afetado, detalhes_evento_json, status_operacao, mensagem_log, created_at
+            ) VALUES (
+                $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11
+            );
+        """
+        params_list = [
+            (
+                log_entry.id,
+                log_entry.timestamp_evento,
+                log_entry.tipo_evento,
+                log_entry.app_origem,
+                log_entry.usuario_operador,
+                log_entry.related_record_id,
+                log_entry.client_entity_id_afetado,
+                log_entry.detalhes_evento_json, # dict: serializado pelo codec JSONB do pool
+                log_entry.status_operacao,
+                log_entry.mensagem_log,
+                log_entry.created_at
+            )
+            for log_entry in log_entries
+        ]
+
+        try:
+            async with self.db_manager.get_connection() as conn:
+                await conn.executemany(insert_sql, params_list)
+                return len(params_list)
+        except Exception as e:
+            logger.error("Erro inesperado ao adicionar lote de %s logs: %s", len(params_list), e, exc_info=True)
+            return 0
+
     async def get_all_logs(self, limit: int = 100, app_name: Optional[str] = None, tipo_evento: Optional[str] = None) -> List[LogEntry]:
         """
         Recupera registros de log, com opções de filtro e limite.
@@ -102,8 +139,6 @@ class LogRepository:
                 processed_logs = []
                 for row in rows:
                     row_as_dict = dict(row)
-                    if isinstance(row_as_dict.get('detalhes_evento_json'), str):
-                        row_as_dict['detalhes_evento_json'] = json.loads(row_as_dict['detalhes_evento_json'])
                     
                     # CORRIGIDO: Mapeia timestamp_evento do DB para o campo timestamp_evento do modelo
                     if 'timestamp_evento' in row_as_dict:
@@ -112,6 +147,6 @@ class LogRepository:
                     processed_logs.append(LogEntry.model_validate(row_as_dict))
                 return processed_logs
         except Exception as e:
-            logger.error(f"Erro ao buscar logs: {e}", exc_info=True)
+            logger.error("Erro ao buscar logs: %s", e, exc_info=True)
             return []
 
@@ -54,14 +54,14 @@ class QualificationRepository:
             async with self.db_manager.get_connection() as conn:
                 row = await conn.fetchrow(insert_sql, *params)
                 if row:
-                    logger.info(f"Registro de qualificação pendente criado: {pending_record.id} para record {pending_record.validation_record_id}")
+                    logger.info("Registro de qualificação pendente criado: %s para record %s", pending_record.id, pending_record.validation_record_id)
                     return QualificacaoPendente.model_validate(row)
             return None
         except asyncpg.exceptions.UniqueViolationError:
-            logger.warning(f"Tentativa de criar qualificacao_pendente duplicada para validation_record_id: {pending_record.validation_record_id}")
+            logger.warning("Tentativa de criar qualificacao_pendente duplicada para validation_record_id: %s", pending_record.validation_record_id)
             return None
         except Exception as e:
-            logger.error(f"Erro ao criar registro de qualificação pendente para record {pending_record.validation_record_id}: {e}", exc_info=True)
+            logger.error("Erro ao criar registro de qualificação pendente para record %s: %s", pending_record.validation_record_id, e, exc_info=True)
             return None
 
     async def get_pending_qualifications_for_revalidation(self, limit: int = 100) -> List[QualificacaoPendente]:
@@ -81,7 +81,7 @@ class QualificationRepository:
                 rows = await conn.fetch(select_sql, now, limit)
                 return [QualificacaoPendente.model_validate(row) for row in rows]
         except Exception as e:
-            logger.error(f"Erro ao buscar registros pendentes para revalidação: {e}", exc_info=True)
+            logger.error("Erro ao buscar registros pendentes para revalidação: %s", e, exc_info=True)
             return []
 
     async def update_pending_qualification(self, pending_record: QualificacaoPendente) -> Optional[QualificacaoPendente]:
@@ -111,11 +111,11 @@ class QualificationRepository:
             async with self.db_manager.get_connection() as conn:
                 row = await conn.fetchrow(update_sql, *params)
                 if row:
-                    logger.info(f"Registro de qualificação pendente atualizado: {pending_record.id}")
+                    logger.info("Registro de qualificação pendente atualizado: %s", pending_record.id)
                     return QualificacaoPendente.model_validate(row)
             return None
         except Exception as e:
-            logger.error(f"Erro ao atualizar registro de qualificação pendente {pending_record.id}: {e}", exc_info=True)
+            logger.error("Erro ao atualizar registro de qualificação pendente %s: %s", pending_record.id, e, exc_info=True)
             return None
 
     async def delete_pending_qualification(self, pending_id: uuid.UUID) -> bool:
@@ -127,11 +127,11 @@ class QualificationRepository:
             async with self.db_manager.get_connection() as conn:
                 status = await conn.execute(delete_sql, pending_id)
                 if status == "DELETE 1":
-                    logger.info(f"Registro de qualificação pendente {pending_id} removido.")
+                    logger.info("Registro de qualificação pendente %s removido.", pending_id)
                     return True
             return False
         except Exception as e:
-            logger.error(f"Erro ao remover registro de qualificação pendente {pending_id}: {e}", exc_info=True)
+            logger.error("Erro ao remover registro de qualificação pendente %s: %s", pending_id, e, exc_info=True)
             return False
 
     async def create_invalid_record_archive(self, invalid_record: InvalidosQualificados) -> Optional[InvalidosQualificados]:
@@ -156,14 +156,14 @@ class QualificationRepository:
             async with self.db_manager.get_connection() as conn:
                 row = await conn.fetchrow(insert_sql, *params)
                 if row:
-                    logger.info(f"Registro arquivado como inválido: {invalid_record.id} para record {invalid_record.validation_record_id}")
+                    logger.info("Registro arquivado como inválido: %s para record %s", invalid_record.id, invalid_record.validation_record_id)
                     return InvalidosQualificados.model_validate(row)
             return None
         except asyncpg.exceptions.UniqueViolationError:
-            logger.warning(f"Tentativa de arquivar invalidos_desqualificados duplicado para validation_record_id: {invalid_record.validation_record_id}")
+            logger.warning("Tentativa de arquivar invalidos_desqualificados duplicado para validation_record_id: %s", invalid_record.validation_record_id)
             return None
         except Exception as e:
-            logger.error(f"Erro ao arquivar registro inválido para record {invalid_record.validation_record_id}: {e}", exc_info=True)
+            logger.error("Erro ao arquivar registro inválido para record %s: %s", invalid_record.validation_record_id, e, exc_info=True)
             return None
 
     async def get_invalid_record_archive(self, validation_record_id: uuid.UUID) -> Optional[InvalidosQualificados]:
@@ -178,7 +178,7 @@ class QualificationRepository:
                     return InvalidosQualificados.model_validate(row)
             return None
         except Exception as e:
-            logger.error(f"Erro ao buscar registro inválido por validation_record_id {validation_record_id}: {e}", exc_info=True)
+            logger.error("Erro ao buscar registro inválido por validation_record_id %s: %s", validation_record_id, e, exc_info=True)
             return None
 
     # --- Métodos para interagir com a tabela client_entities (Golden Records) ---
@@ -198,7 +198,7 @@ class QualificationRepository:
                     return dict(row)
             return None
         except Exception as e:
-            logger.error(f"Erro ao buscar client_entity por documento principal: {e}", exc_info=True)
+            logger.error("Erro ao buscar client_entity por documento principal: %s", e, exc_info=True)
             return None
 
     async def create_client_entity(self, client_entity_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -222,6 +222,7 @@ class QualificationRepository:
                 $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11
             ) RETURNING *;
         """
+        now = datetime.now(timezone.utc) # Uma única leitura do relógio para created_at e updated_at
         params = (
             client_entity_data.get("main_document_normalized"),
             client_entity_data.get("golden_record_cpf_cnpj_id"),
@@ -232,21 +233,21 @@ class QualificationRepository:
             client_entity_data.get("consolidated_data", {}), # Garantir que é um dict para JSONB
             client_entity_data.get("relationship_type"),
             client_entity_data.get("cclub"),
-            datetime.now(timezone.utc),
-            datetime.now(timezone.utc)
+            now, # created_at
+            now # updated_at
         )
         try:
             async with self.db_manager.get_connection() as conn:
                 row = await conn.fetchrow(insert_sql, *params)
                 if row:
-                    logger.info(f"Golden Record criado para {client_entity_data.get('main_document_normalized')}: {row['id']}")
+                    logger.info("Golden Record criado para %s: %s", client_entity_data.get('main_document_normalized'), row['id'])
                     return dict(row)
             return None
         except asyncpg.exceptions.UniqueViolationError:
-            logger.warning(f"Tentativa de criar Golden Record duplicado para main_document_normalized: {client_entity_data.get('main_document_normalized')}")
+            logger.warning("Tentativa de criar Golden Record duplicado para main_document_normalized: %s", client_entity_data.get('main_document_normalized'))
             return None
         except Exception as e:
-            logger.error(f"Erro ao criar Golden Record para {client_entity_data.get('main_document_normalized')}: {e}", exc_info=True)
+            logger.error("Erro ao criar Golden Record para %s: %s", client_entity_data.get('main_document_normalized'), e, exc_info=True)
             return None
 
     async def update_client_entity(self, client_entity_id: uuid.UUID, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -266,7 +267,7 @@ class QualificationRepository:
             param_counter += 1
         
         if not set_clauses:
-            logger.warning(f"Nenhum campo para atualizar para client_entity_id {client_entity_id}.")
+            logger.warning("Nenhum campo para atualizar para client_entity_id %s.", client_entity_id)
             return None
 
         update_sql = f"""
@@ -281,11 +282,70 @@ class QualificationRepository:
             async with self.db_manager.get_connection() as conn:
                 row = await conn.fetchrow(update_sql, *params)
                 if row:
-                    logger.info(f"Golden Record atualizado para ID {client_entity_id}")
+                    logger.info("Golden Record atualizado para ID %s", client_entity_id)
                     return dict(row)
             return None
         except Exception as e:
-            logger.error(f"Erro ao atualizar Golden Record {client_entity_id}: {e}", exc_info=True)
+            logger.error("Erro ao atualizar Golden Record %s: %s", client_entity_id, e, exc_info=True)
+            return None
+
+    async def upsert_client_entity(self, client_entity_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Cria ou atualiza o Golden Record de um documento principal em uma única ida ao banco
+        (INSERT ... ON CONFLICT (main_document_normalized) DO UPDATE ... RETURNING *).
+        Substitui a sequência SELECT + INSERT/UPDATE: além de economizar um round-trip, é atômico,
+        de modo que duas requisições concorrentes para o mesmo documento não tentam criar a entidade duas vezes.
+        Na atualização, apenas consolidated_data e os IDs de Golden Record são sobrescritos
+        (cclub e relationship_type mantêm os valores da criação).
+        O dicionário retornado inclui a chave 'inserted' (True se a entidade foi criada agora).
+        """
+        upsert_sql = """
+            INSERT INTO client_entities (
+                main_document_normalized,
+                golden_record_cpf_cnpj_id,
+                golden_record_address_id,
+                golden_record_phone_id,
+                golden_record_email_id,
+                golden_record_cep_id,
+                consolidated_data,
+                relationship_type,
+                cclub,
+                created_at, updated_at
+            ) VALUES (
+                $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11
+            )
+            ON CONFLICT (main_document_normalized) DO UPDATE SET
+                golden_record_cpf_cnpj_id = EXCLUDED.golden_record_cpf_cnpj_id,
+                golden_record_address_id = EXCLUDED.golden_record_address_id,
+                golden_record_phone_id = EXCLUDED.golden_record_phone_id,
+                golden_record_email_id = EXCLUDED.golden_record_email_id,
+                golden_record_cep_id = EXCLUDED.golden_record_cep_id,
+                consolidated_data = EXCLUDED.consolidated_data,
+                updated_at = EXCLUDED.updated_at
+            RETURNING *, (xmax = 0) AS inserted;
+        """
+        now = datetime.now(timezone.utc)
+        params = (
+            client_entity_data.get("main_document_normalized"),
+            client_entity_data.get("golden_record_cpf_cnpj_id"),
+            client_entity_data.get("golden_record_address_id"),
+            client_entity_data.get("golden_record_phone_id"),
+            client_entity_data.get("golden_record_email_id"),
+            client_entity_data.get("golden_record_cep_id"),
+            client_entity_data.get("consolidated_data", {}), # Garantir que é um dict para JSONB
+            client_entity_data.get("relationship_type"),
+            client_entity_data.get("cclub"),
+            now,
+            now
+        )
+        try:
+            async with self.db_manager.get_connection() as conn:
+                row = await conn.fetchrow(upsert_sql, *params)
+                if row:
+                    return dict(row)
+            return None
+        except Exception as e:
+            logger.error("Erro ao criar/atualizar Golden Record para %s: %s", client_entity_data.get('main_document_normalized'), e, exc_info=True)
             return None
 
     async def get_validation_record_details(self, record_id: uuid.UUID) -> Optional[ValidationRecord]:
@@ -303,5 +363,5 @@ class QualificationRepository:
                     return ValidationRecord.model_validate(row)
             return None
         except Exception as e:
-            logger.error(f"Erro ao obter detalhes do ValidationRecord {record_id}: {e}", exc_info=True)
+            logger.error("Erro ao obter detalhes do ValidationRecord %s: %s", record_id, e, exc_info=True)
             return None
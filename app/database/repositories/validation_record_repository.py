@@ -1,17 +1,34 @@
 # app/database/repositories/validation_record_repository.py
 
 import logging
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 from uuid import UUID
 import asyncpg # Importa asyncpg diretamente para os tipos de exceção e conexão
 from app.database.manager import DatabaseManager
 from app.models.validation_record import ValidationRecord # Importa o modelo ValidationRecord
 from datetime import datetime, timezone
 import uuid # Importa uuid para uuid.uuid4()
-import json # Importar a biblioteca json
 
 logger = logging.getLogger(__name__)
 
+# Colunas do histórico (campos do HistoryRecordResponse). O short_id_alias ausente é gerado no próprio SQL
+# com a mesma regra de ValidationRecord.generate_short_id_alias (8 primeiros hex do SHA-256 do id).
+HISTORY_COLUMNS_SQL = """
+    id, dado_original, dado_normalizado, is_valido, mensagem, tipo_validacao, data_validacao,
+    app_name, client_identifier, is_golden_record,
+    COALESCE(short_id_alias, left(encode(sha256(id::text::bytea), 'hex'), 8)) AS short_id_alias,
+    is_deleted, deleted_at, created_at, updated_at, client_entity_id
+"""
+
+# Histórico de uma aplicação, mais recentes primeiro. Texto SQL fixo: o filtro de deletados é parâmetro ($2),
+# de modo que as duas variantes (com e sem deletados) compartilham o mesmo prepared statement no cache do asyncpg.
+HISTORY_BY_APP_NAME_SQL = f"""
+    SELECT {HISTORY_COLUMNS_SQL} FROM validation_records
+    WHERE app_name = $1 AND (is_deleted = FALSE OR $2::boolean)
+    ORDER BY data_validacao DESC
+    LIMIT $3;
+"""
+
 class ValidationRecordRepository:
     """
     Gerencia as operações de persistência para registros de validação no banco de dados.
@@ -20,18 +37,22 @@ class ValidationRecordRepository:
         self.db_manager = db_manager
         logger.info("ValidationRecordRepository inicializado.")
 
-    async def create_record(self, record: ValidationRecord) -> Optional[ValidationRecord]:
+    async def create_record(self, record: ValidationRecord) -> ValidationRecord:
         """
         Cria um novo registro de validação no banco de dados.
+        O INSERT ... RETURNING * sempre devolve a linha inserida; em caso de erro do banco
+        a exceção é registrada no log e relançada para o chamador.
         """
         # Garante que timestamps e UUIDs são definidos antes da inserção, se ainda não estiverem.
         # O banco de dados também pode definir defaults, mas é mais seguro fazer aqui.
         if not record.id:
             record.id = uuid.uuid4()
-        if not record.created_at:
-            record.created_at = datetime.now(timezone.utc)
-        if not record.updated_at:
-            record.updated_at = datetime.now(timezone.utc)
+        if not record.created_at or not record.updated_at:
+            now_utc = datetime.now(timezone.utc) # Uma única leitura do relógio para os dois campos
+            if not record.created_at:
+                record.created_at = now_utc
+            if not record.updated_at:
+                record.updated_at = now_utc
         if not record.short_id_alias and record.id: # Garante que o alias é gerado se o ID existe
             record.short_id_alias = record.generate_short_id_alias()
 
@@ -48,9 +69,9 @@ class ValidationRecordRepository:
                 $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22, $23, $24, $25, $26, $27
             ) RETURNING *;
         """
-        # CONVERSÃO PARA JSON STRING ao INSERIR:
-        validation_details_json = record.validation_details.copy() if record.validation_details is not None else {}
-        regra_negocio_parametros_json = record.regra_negocio_parametros.copy() if record.regra_negocio_parametros is not None else None
+        # Campos JSONB vão como dicts: o codec registrado no pool (orjson) faz a serialização
+        validation_details_json = record.validation_details if record.validation_details is not None else {}
+        regra_negocio_parametros_json = record.regra_negocio_parametros
 
         params = (
             record.id,
@@ -63,12 +84,12 @@ class ValidationRecordRepository:
             record.app_name,
             record.client_identifier,
             record.short_id_alias,
-            json.dumps(validation_details_json), # CONVERTIDO PARA JSON STRING
+            validation_details_json,
             record.data_validacao,
             record.regra_negocio_codigo,
             record.regra_negocio_descricao,
             record.regra_negocio_tipo,
-            json.dumps(regra_negocio_parametros_json) if regra_negocio_parametros_json is not None else None, # CONVERTIDO PARA JSON STRING
+            regra_negocio_parametros_json,
             record.usuario_criacao,
             record.usuario_atualizacao,
             record.is_deleted,
@@ -84,30 +105,26 @@ class ValidationRecordRepository:
         try:
             async with self.db_manager.get_connection() as conn:
                 row = await conn.fetchrow(insert_sql, *params)
-                if row:
-                    logger.debug(f"DEBUG: Row returned from DB: {row}")
-                    logger.debug(f"DEBUG: Type of row: {type(row)}")
-                    
-                    # CONVERSÃO EXPLÍCITA ao LER: Converter asyncpg.Record para dict e, se JSONB for string, carregar
-                    row_as_dict = dict(row)
-                    if isinstance(row_as_dict.get('validation_details'), str):
-                        row_as_dict['validation_details'] = json.loads(row_as_dict['validation_details'])
-                    if isinstance(row_as_dict.get('regra_negocio_parametros'), str):
-                        row_as_dict['regra_negocio_parametros'] = json.loads(row_as_dict['regra_negocio_parametros'])
+                logger.debug("DEBUG: Row returned from DB: %s", row)
+                logger.debug("DEBUG: Type of row: %s", type(row))
 
-                    logger.debug(f"DEBUG: Row as dict (after JSON loads): {row_as_dict}")
-                    logger.debug(f"DEBUG: Type of row as dict (after JSON loads): {type(row_as_dict)}")
-                    return ValidationRecord.model_validate(row_as_dict) # Validar o dicionário
-                return None
+                # Campos JSONB já chegam como dict (codec do pool)
+                row_as_dict = dict(row)
+
+                logger.debug("DEBUG: Row as dict: %s", row_as_dict)
+                logger.debug("DEBUG: Type of row as dict: %s", type(row_as_dict))
+                # Linha recém-gravada, com todas as colunas já tipadas pelo asyncpg (UUID, datetime, dict):
+                # model_construct apenas copia os campos, sem revalidar cada um deles a cada INSERT.
+                return ValidationRecord.model_construct(**row_as_dict)
         except asyncpg.exceptions.NotNullViolationError as e:
-            logger.error(f"Erro ao criar registro no banco de dados: {e}\nDETAIL: {e.detail}")
-            return None
+            logger.error("Erro ao criar registro no banco de dados: %s\nDETAIL: %s", e, e.detail)
+            raise
         except asyncpg.exceptions.UniqueViolationError as e:
-            logger.error(f"Erro de violação de unicidade ao criar registro: {e}")
-            return None
+            logger.error("Erro de violação de unicidade ao criar registro: %s", e)
+            raise
         except Exception as e:
-            logger.error(f"Erro inesperado ao criar registro de validação: {e}", exc_info=True)
-            return None
+            logger.error("Erro inesperado ao criar registro de validação: %s", e, exc_info=True)
+            raise
 
     async def get_record_by_id(self, record_id: UUID) -> Optional[ValidationRecord]:
         """
@@ -119,77 +136,89 @@ class ValidationRecordRepository:
                 row = await conn.fetchrow(select_sql, record_id)
                 if row:
                     row_as_dict = dict(row)
-                    if isinstance(row_as_dict.get('validation_details'), str):
-                        row_as_dict['validation_details'] = json.loads(row_as_dict['validation_details'])
-                    if isinstance(row_as_dict.get('regra_negocio_parametros'), str):
-                        row_as_dict['regra_negocio_parametros'] = json.loads(row_as_dict['regra_negocio_parametros'])
                     return ValidationRecord.model_validate(row_as_dict)
                 return None
         except Exception as e:
-            logger.error(f"Erro ao buscar registro por ID {record_id}: {e}", exc_info=True)
+            logger.error("Erro ao buscar registro por ID %s: %s", record_id, e, exc_info=True)
             return None
 
-    async def get_records_by_app_name(self, app_name: str, limit: int = 10, include_deleted: bool = False) -> List[ValidationRecord]:
+    async def get_history_rows_by_app_name(self, app_name: str, limit: int = 10, include_deleted: bool = False) -> List[Dict[str, Any]]:
         """
-        Recupera registros de validação por nome da aplicação.
+        Recupera o histórico de uma aplicação: apenas as colunas exibidas (HistoryRecordResponse),
+        como dicts simples, sem validar cada linha como ValidationRecord.
+        Erros são registrados no log e relançados, para que o serviço responda com erro em vez de uma lista vazia.
         """
-        sql = "SELECT * FROM validation_records WHERE app_name = $1"
-        params = [app_name]
-        if not include_deleted:
-            sql += " AND is_deleted = FALSE"
-        sql += " ORDER BY data_validacao DESC LIMIT $2;"
-        params.append(limit)
+        try:
+            async with self.db_manager.get_connection() as conn:
+                rows = await conn.fetch(HISTORY_BY_APP_NAME_SQL, app_name, include_deleted, limit)
+                return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error("Erro ao buscar histórico para app '%s': %s", app_name, e, exc_info=True)
+            raise
 
+    async def stream_history_rows_by_app_name(self, app_name: str, limit: int = 10, include_deleted: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Versão em streaming de get_history_rows_by_app_name: lê as linhas por um cursor no servidor
+        (em blocos de 64 linhas) e as entrega uma a uma, sem materializar a lista inteira em memória.
+        Erros são registrados no log e relançados, pois parte das linhas já pode ter sido entregue.
+        A conexão (e a transação do cursor) fica presa ao gerador até ele ser consumido ou fechado:
+        quem chama deve limitar 'limit' para não reter conexões do pool por tempo indeterminado.
+        """
         try:
             async with self.db_manager.get_connection() as conn:
-                rows = await conn.fetch(sql, *params)
-                # CONVERSÃO EXPLÍCITA ao LER:
-                processed_rows = []
-                for row in rows:
-                    row_as_dict = dict(row)
-                    if isinstance(row_as_dict.get('validation_details'), str):
-                        row_as_dict['validation_details'] = json.loads(row_as_dict['validation_details'])
-                    if isinstance(row_as_dict.get('regra_negocio_parametros'), str):
-                        row_as_dict['regra_negocio_parametros'] = json.loads(row_as_dict['regra_negocio_parametros'])
-                    processed_rows.append(ValidationRecord.model_validate(row_as_dict))
-                return processed_rows
+                # Cursores do asyncpg exigem uma transação aberta
+                async with conn.transaction():
+                    async for row in conn.cursor(HISTORY_BY_APP_NAME_SQL, app_name, include_deleted, limit, prefetch=64):
+                        yield dict(row)
         except Exception as e:
-            logger.error(f"Erro ao buscar histórico para app '{app_name}': {e}", exc_info=True)
-            return []
+            logger.error("Erro ao transmitir histórico para app '%s': %s", app_name, e, exc_info=True)
+            raise
 
-    async def soft_delete_record(self, record_id: UUID) -> bool:
+    async def soft_delete_record(self, record_id: UUID) -> Optional[ValidationRecord]:
         """
         Marca um registro como logicamente deletado.
+        Retorna o registro atualizado no mesmo round-trip (UPDATE ... RETURNING *),
+        ou None se o registro não existir ou já estiver deletado.
         """
         update_sql = """
             UPDATE validation_records
             SET is_deleted = TRUE, deleted_at = NOW(), updated_at = NOW()
-            WHERE id = $1 AND is_deleted = FALSE;
+            WHERE id = $1 AND is_deleted = FALSE
+            RETURNING *;
         """
         try:
             async with self.db_manager.get_connection() as conn:
-                result = await conn.execute(update_sql, record_id)
-                return result == "UPDATE 1"
+                row = await conn.fetchrow(update_sql, record_id)
+                if row:
+                    row_as_dict = dict(row)
+                    return ValidationRecord.model_validate(row_as_dict)
+                return None
         except Exception as e:
-            logger.error(f"Erro ao executar soft delete para o registro {record_id}: {e}", exc_info=True)
-            return False
+            logger.error("Erro ao executar soft delete para o registro %s: %s", record_id, e, exc_info=True)
+            return None
 
-    async def restore_record(self, record_id: UUID) -> bool:
+    async def restore_record(self, record_id: UUID) -> Optional[ValidationRecord]:
         """
         Restaura um registro que foi logicamente deletado.
+        Retorna o registro atualizado no mesmo round-trip (UPDATE ... RETURNING *),
+        ou None se o registro não existir ou não estiver deletado.
         """
         update_sql = """
             UPDATE validation_records
             SET is_deleted = FALSE, deleted_at = NULL, updated_at = NOW()
-            WHERE id = $1 AND is_deleted = TRUE;
+            WHERE id = $1 AND is_deleted = TRUE
+            RETURNING *;
         """
         try:
             async with self.db_manager.get_connection() as conn:
-                result = await conn.execute(update_sql, record_id)
-                return result == "UPDATE 1"
+                row = await conn.fetchrow(update_sql, record_id)
+                if row:
+                    row_as_dict = dict(row)
+                    return ValidationRecord.model_validate(row_as_dict)
+                return None
         except Exception as e:
-            logger.error(f"Erro ao restaurar registro {record_id}: {e}", exc_info=True)
-            return False
+            logger.error("Erro ao restaurar registro %s: %s", record_id, e, exc_info=True)
+            return None
 
     async def find_duplicate_record(self, dado_normalizado: str, tipo_validacao: str, app_name: str, exclude_record_id: Optional[UUID] = None) -> Optional[ValidationRecord]:
         """
@@ -217,14 +246,10 @@ class ValidationRecordRepository:
                 row = await conn.fetchrow(sql, *params)
                 if row:
                     row_as_dict = dict(row)
-                    if isinstance(row_as_dict.get('validation_details'), str):
-                        row_as_dict['validation_details'] = json.loads(row_as_dict['validation_details'])
-                    if isinstance(row_as_dict.get('regra_negocio_parametros'), str):
-                        row_as_dict['regra_negocio_parametros'] = json.loads(row_as_dict['regra_negocio_parametros'])
                     return ValidationRecord.model_validate(row_as_dict)
                 return None
         except Exception as e:
-            logger.error(f"Erro ao buscar duplicata para {dado_normalizado}/{tipo_validacao}/{app_name}: {e}", exc_info=True)
+            logger.error("Erro ao buscar duplicata para %s/%s/%s: %s", dado_normalizado, tipo_validacao, app_name, e, exc_info=True)
             return None
 
     async def find_golden_record(self, dado_normalizado: str, tipo_validacao: str) -> Optional[ValidationRecord]:
@@ -247,14 +272,10 @@ class ValidationRecordRepository:
                 row = await conn.fetchrow(sql, *params)
                 if row:
                     row_as_dict = dict(row)
-                    if isinstance(row_as_dict.get('validation_details'), str):
-                        row_as_dict['validation_details'] = json.loads(row_as_dict['validation_details'])
-                    if isinstance(row_as_dict.get('regra_negocio_parametros'), str):
-                        row_as_dict['regra_negocio_parametros'] = json.loads(row_as_dict['regra_negocio_parametros'])
                     return ValidationRecord.model_validate(row_as_dict)
                 return None
         except Exception as e:
-            logger.error(f"Erro ao buscar Golden Record para {dado_normalizado}/{tipo_validacao}: {e}", exc_info=True)
+            logger.error("Erro ao buscar Golden Record para %s/%s: %s", dado_normalizado, tipo_validacao, e, exc_info=True)
             return None
 
     async def update_golden_record_status(self, record_id: UUID, is_golden: bool, golden_record_id: Optional[UUID]) -> bool:
@@ -272,12 +293,13 @@ class ValidationRecordRepository:
                 result = await conn.execute(update_sql, *params)
                 return result == "UPDATE 1"
         except Exception as e:
-            logger.error(f"Erro ao atualizar status Golden Record para {record_id}: {e}", exc_info=True)
+            logger.error("Erro ao atualizar status Golden Record para %s: %s", record_id, e, exc_info=True)
             return False
 
     async def update_record(self, record_id: UUID, updates: Dict[str, Any]) -> bool:
         """
         Atualiza campos específicos de um registro de validação.
+        O updated_at é sempre definido pelo banco (NOW()); um 'updated_at' em 'updates' é ignorado (com aviso no log).
         Args:
             record_id (UUID): O ID do registro a ser atualizado.
             updates (Dict[str, Any]): Um dicionário de campos para atualizar e seus novos valores.
@@ -291,16 +313,16 @@ class ValidationRecordRepository:
         params = []
         param_counter = 1
 
-        updates["updated_at"] = datetime.now(timezone.utc) # Sempre atualiza o timestamp
-
         for field, value in updates.items():
+            if field == "updated_at":
+                logger.warning("update_record: 'updated_at' informado para o registro %s ignorado; o valor é definido pelo banco.", record_id)
+                continue # Sempre definido pelo próprio banco, logo abaixo
             set_clauses.append(f"{field} = ${param_counter}")
-            # CONVERSÃO PARA JSON STRING para campos JSONB que podem estar em 'updates'
-            if field in ["validation_details", "regra_negocio_parametros"] and isinstance(value, dict):
-                params.append(json.dumps(value))
-            else:
-                params.append(value)
+            # Campos JSONB (validation_details, regra_negocio_parametros) vão como dicts: o codec do pool serializa
+            params.append(value)
             param_counter += 1
+        # Sempre atualiza o timestamp, com o relógio do banco (sem parâmetro extra e sem alterar o dict recebido)
+        set_clauses.append("updated_at = NOW()")
         
         # Adiciona o ID ao final dos parâmetros para a cláusula WHERE
         set_clauses_str = ", ".join(set_clauses)
@@ -312,7 +334,7 @@ class ValidationRecordRepository:
                 result = await conn.execute(update_sql, *params)
                 return result == "UPDATE 1"
         except Exception as e:
-            logger.error(f"Erro ao atualizar registro {record_id} com updates {updates}: {e}", exc_info=True)
+            logger.error("Erro ao atualizar registro %s com updates %s: %s", record_id, updates, e, exc_info=True)
             return False
 
     async def get_all_records_by_normalized_data(self, dado_normalizado: str, tipo_validacao: str) -> List[ValidationRecord]:
@@ -328,16 +350,11 @@ class ValidationRecordRepository:
         try:
             async with self.db_manager.get_connection() as conn:
                 rows = await conn.fetch(select_sql, dado_normalizado, tipo_validacao)
-                # CONVERSÃO EXPLÍCITA ao LER:
                 processed_rows = []
                 for row in rows:
                     row_as_dict = dict(row)
-                    if isinstance(row_as_dict.get('validation_details'), str):
-                        row_as_dict['validation_details'] = json.loads(row_as_dict['validation_details'])
-                    if isinstance(row_as_dict.get('regra_negocio_parametros'), str):
-                        row_as_dict['regra_negocio_parametros'] = json.loads(row_as_dict['regra_negocio_parametros'])
                     processed_rows.append(ValidationRecord.model_validate(row_as_dict))
                 return processed_rows
         except Exception as e:
-            logger.error(f"Erro ao buscar registros por dado normalizado {dado_normalizado} e tipo {tipo_validacao}: {e}", exc_info=True)
+            logger.error("Erro ao buscar registros por dado normalizado %s e tipo %s: %s", dado_normalizado, tipo_validacao, e, exc_info=True)
             return []
@@ -59,5 +59,5 @@ class ClientEntity(BaseModel):
             setattr(self, field_name, record_id) 
             self.updated_at = datetime.now(timezone.utc)
         else:
-            logger.warning(f"Tipo de validação desconhecido '{validation_type}' para ClientEntity.update_golden_record_id. O ID do Golden Record não foi atualizado.")
+            logger.warning("Tipo de validação desconhecido '%s' para ClientEntity.update_golden_record_id. O ID do Golden Record não foi atualizado.", validation_type)
 
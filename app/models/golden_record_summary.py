@@ -4,6 +4,7 @@ from typing import Optional
 from pydantic import BaseModel, Field, UUID4 # Adicionado UUID4
 from datetime import datetime
 import uuid # Necessário para uuid.UUID
+import json # Import no nível do módulo (antes era feito a cada chamada de to_json)
 
 class GoldenRecordSummary(BaseModel):
     """
@@ -62,5 +63,5 @@ class GoldenRecordSummary(BaseModel):
         """
         Retorna uma representação do Golden Record como uma string JSON.
         """
-        import json
+        # json da stdlib com default=str: mantém o formato já produzido (ex.: data_validacao como str(datetime))
         return json.dumps(self.to_dict(), default=str)
\ No newline at end of file
@@ -79,7 +79,8 @@ class ValidationRecord(BaseModel):
             return "" # Retorna string vazia se não houver ID para gerar hash
         
         # Converte o UUID para string e então para bytes para o hashing
-        hash_object = hashlib.sha256(str(self.id).encode('utf-8'))
+        # usedforsecurity=False: o alias é apenas de exibição (dispensa restrições de FIPS do OpenSSL)
+        hash_object = hashlib.sha256(str(self.id).encode('utf-8'), usedforsecurity=False)
         # Retorna os primeiros 'length' caracteres do hash hexadecimal
         return hash_object.hexdigest()[:length]
     # Hook do Pydantic para preencher o alias automaticamente ao criar/validar
@@ -6,6 +6,9 @@ from app.rules.address.cep.validator import CEPValidator # Importar o CEPValidat
 
 logger = logging.getLogger(__name__)
 
+# Campos esperados e obrigatórios (tupla imutável, criada uma única vez)
+_REQUIRED_FIELDS = ("logradouro", "numero", "bairro", "cidade", "estado", "cep")
+
 class AddressRuleCodes:
     RN_ADDR001 = "RN_ADDR001"  # Endereço válido e completo
     RN_ADDR002 = "RN_ADDR002"  # Endereço com campos obrigatórios ausentes
@@ -38,7 +41,7 @@ class AddressValidator(BaseValidator):
             Dict[str, Any]: Um dicionário com o resultado da validação padronizado.
         """
         original_address_data = data # Captura o dado original
-        logger.info(f"Iniciando validação de endereço: {original_address_data}...")
+        logger.info("Iniciando validação de endereço: %s...", original_address_data)
 
         # 1. Verificação de Input Vazio ou Inválido
         if not isinstance(original_address_data, dict) or not original_address_data:
@@ -51,9 +54,17 @@ class AddressValidator(BaseValidator):
                 business_rule_applied={"code": AddressRuleCodes.RN_ADDR007, "type": "Endereço - Validação Primária", "name": "Input de Endereço Vazio ou Inválido"}
             )
 
-        # Campos esperados e obrigatórios
-        required_fields = ["logradouro", "numero", "bairro", "cidade", "estado", "cep"]
-        missing_fields = [f for f in required_fields if not original_address_data.get(f) or not str(original_address_data.get(f)).strip()]
+        # Uma única passada pelos campos obrigatórios: cada valor é lido, convertido e limpo uma vez,
+        # separando os ausentes (vazios ou só espaços) dos já normalizados
+        missing_fields = []
+        normalized_address = {}
+        for field in _REQUIRED_FIELDS:
+            raw_value = original_address_data.get(field)
+            value = str(raw_value).strip() if raw_value else ""
+            if value:
+                normalized_address[field] = value
+            else:
+                missing_fields.append(field)
 
         is_valid = True
         message = "Endereço válido."
@@ -84,17 +95,13 @@ class AddressValidator(BaseValidator):
                 business_rule_applied={"code": business_rule_code, "type": "Endereço - Validação Primária", "name": "Campos Obrigatórios Ausentes"}
             )
 
-        # Normaliza e valida campos individuais (ex: limpeza, tipo)
-        normalized_address = {}
-        for field in required_fields:
-            value = str(original_address_data[field]).strip()
-            normalized_address[field] = value
-            # Exemplo de validação de campo individual (não exaustivo)
-            if field == "numero" and not value.replace('-', '').isalnum(): # Aceita números e hífens
-                details["inconsistencies"].append(f"Número de endereço contém caracteres inválidos: {value}")
-                details["reason"].append("invalid_address_number_chars")
-                is_valid = False # Considera uma inconsistência leve, mas pode ser fatal dependendo da regra
-                business_rule_code = AddressRuleCodes.RN_ADDR005
+        # Valida campos individuais já normalizados (exemplo não exaustivo)
+        numero = normalized_address["numero"]
+        if not numero.replace('-', '').isalnum(): # Aceita números e hífens
+            details["inconsistencies"].append(f"Número de endereço contém caracteres inválidos: {numero}")
+            details["reason"].append("invalid_address_number_chars")
+            is_valid = False # Considera uma inconsistência leve, mas pode ser fatal dependendo da regra
+            business_rule_code = AddressRuleCodes.RN_ADDR005
             
         details["normalized_address"] = normalized_address
 
@@ -140,7 +147,7 @@ class AddressValidator(BaseValidator):
             business_rule_code = AddressRuleCodes.RN_ADDR006
             details["reason"].append("cep_not_found_in_external_db")
             is_valid = True # Considera válido, mas com aviso (WARNING)
-            logger.warning(f"AddressValidation: {message} para CEP {normalized_address['cep']}")
+            logger.warning("AddressValidation: %s para CEP %s", message, normalized_address['cep'])
         elif normalized_address["cep"] == "99999-999":
             details["simulated_consistency"] = False
             message = "Endereço: CEP válido, mas não correspondente aos demais campos do endereço (simulado)."
@@ -9,6 +9,8 @@ from app.rules.base import BaseValidator # Importa a classe BaseValidator
 
 logger = logging.getLogger(__name__)
 
+_NON_DIGIT_RE = re.compile(r'\D')
+
 class CEPValidator(BaseValidator): # Herda de BaseValidator
     """
     Validador de Códigos de Endereçamento Postal (CEP) para o Brasil.
@@ -29,7 +31,7 @@ class CEPValidator(BaseValidator): # Herda de BaseValidator
 
     def _clean_cep(self, cep: str) -> str:
         """Remove caracteres não numéricos do CEP."""
-        return re.sub(r'\D', '', cep)
+        return _NON_DIGIT_RE.sub('', cep)
 
     def _is_sequential_or_repeated(self, cleaned_cep: str) -> bool:
         """Verifica se o CEP tem 4 ou mais dígitos sequenciais ou repetidos."""
@@ -58,7 +60,7 @@ class CEPValidator(BaseValidator): # Herda de BaseValidator
         Simula a consulta à API ViaCEP.
         Em um ambiente real, faria uma requisição HTTP para 'https://viacep.com.br/ws/{cep}/json/'.
         """
-        logger.debug(f"Simulando consulta à API ViaCEP para CEP: {cep}")
+        logger.debug("Simulando consulta à API ViaCEP para CEP: %s", cep)
         await asyncio.sleep(0.05) # Simula um pequeno atraso de rede
 
         # Dados simulados para ViaCEP
@@ -96,7 +98,7 @@ class CEPValidator(BaseValidator): # Herda de BaseValidator
         
         # Simula erro de API (ex: timeout, serviço fora) para alguns CEPs
         if cep == "99999000": # Exemplo de CEP que simula erro de API
-            logger.error(f"Simulando falha de API para o CEP: {cep}")
+            logger.error("Simulando falha de API para o CEP: %s", cep)
             raise Exception("Simulated API connection error or timeout.")
 
         return response_data
@@ -179,9 +181,9 @@ class CEPValidator(BaseValidator): # Herda de BaseValidator
             message = f"Erro ao consultar API externa de CEP: {e}. Validação base pode estar comprometida."
             validation_code = self.VAL_CEP006 # Acessando via self.
             result_details["api_error"] = str(e)
-            logger.error(f"Erro na validação de CEP {cleaned_cep} via API externa: {e}", exc_info=True)
+            logger.error("Erro na validação de CEP %s via API externa: %s", cleaned_cep, e, exc_info=True)
 
-        logger.debug(f"Validação de CEP para '{original_cep}' (limpo: '{cleaned_cep}'): {message}")
+        logger.debug("Validação de CEP para '%s' (limpo: '%s'): %s", original_cep, cleaned_cep, message)
         
         return self._format_result(
             is_valid=is_valid_cep,
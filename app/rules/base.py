@@ -18,7 +18,7 @@ class BaseValidator:
         self.VAL_GENERIC_EMPTY = "VAL_GENERIC_001" # Código para input vazio ou tipo inválido
         self.VAL_GENERIC_VALID = "VAL_GENERIC_002" # Código para input válido
         self.VAL_GENERIC_INVALID = "VAL_GENERIC_003" # Código para input inválido
-        logger.info(f"BaseValidator '{self.origin_name}' inicializado.")
+        logger.info("BaseValidator '%s' inicializado.", self.origin_name)
 
     async def validate(self, data: Any, **kwargs) -> Dict[str, Any]:
         """
@@ -90,7 +90,7 @@ class DecisionRules:
             record.is_golden_record = True
             record.status_qualificacao = "QUALIFIED"
             actions_summary["status_qualificacao_set"] = "QUALIFIED"
-            logger.info(f"Registro {record.id} é um candidato a Golden Record e QUALIFICADO.")
+            logger.info("Registro %s é um candidato a Golden Record e QUALIFICADO.", record.id)
 
             # Tenta criar/atualizar o Client Entity (Golden Record no mestre)
             # Para pessoa_completa, o documento principal seria o CPF
@@ -98,7 +98,6 @@ class DecisionRules:
             main_document_normalized = cpf_validation.get("dado_normalizado") if cpf_validation else None
 
             if main_document_normalized:
-                client_entity = await self.qualification_repo.get_client_entity_by_main_document(main_document_normalized)
                 consolidated_data = self._consolidate_golden_record_data(record)
 
                 # Estes IDs apontam para o ValidationRecord que deu origem ao Golden Record de cada tipo
@@ -113,37 +112,26 @@ class DecisionRules:
                     "golden_record_rg_id": record.id if (individual_validations.get("rg") and individual_validations["rg"].get("is_valid") and individual_validations["rg"].get("business_rule_applied", {}).get("code") == "RN_RG001") else None,
                 }
                 
+                # Cria ou atualiza o Golden Record em uma única operação atômica (upsert)
+                client_entity_data = {
+                    "main_document_normalized": main_document_normalized,
+                    "consolidated_data": consolidated_data,
+                    "relationship_type": "Pessoa Fisica", # Exemplo, pode vir de outro campo (usado apenas na criação)
+                    "cclub": record.client_identifier, # Pode ser o client_identifier ou outro campo dos dados de entrada
+                    **golden_record_ids_to_link
+                }
+                client_entity = await self.qualification_repo.upsert_client_entity(client_entity_data)
                 if client_entity:
-                    # Atualiza o Golden Record existente
-                    update_data = {
-                        "consolidated_data": consolidated_data,
-                        **golden_record_ids_to_link
-                    }
-                    updated_entity = await self.qualification_repo.update_client_entity(client_entity["id"], update_data)
-                    if updated_entity:
-                        record.golden_record_id = updated_entity["id"] # Linka o validation_record ao GR
-                        actions_summary["client_entity_created_or_updated"] = True
-                        logger.info(f"Golden Record existente atualizado para cliente {main_document_normalized}. ID: {updated_entity['id']}")
+                    record.golden_record_id = client_entity["id"] # Linka o validation_record ao GR
+                    actions_summary["client_entity_created_or_updated"] = True
+                    if client_entity.get("inserted"):
+                        logger.info("Novo Golden Record criado para cliente %s. ID: %s", main_document_normalized, client_entity['id'])
                     else:
-                        logger.error(f"Falha ao atualizar Golden Record existente para {main_document_normalized}.")
+                        logger.info("Golden Record existente atualizado para cliente %s. ID: %s", main_document_normalized, client_entity['id'])
                 else:
-                    # Cria um novo Golden Record
-                    new_entity_data = {
-                        "main_document_normalized": main_document_normalized,
-                        "consolidated_data": consolidated_data,
-                        "relationship_type": "Pessoa Fisica", # Exemplo, pode vir de outro campo
-                        "cclub": record.client_identifier, # Pode ser o client_identifier ou outro campo dos dados de entrada
-                        **golden_record_ids_to_link
-                    }
-                    new_entity = await self.qualification_repo.create_client_entity(new_entity_data)
-                    if new_entity:
-                        record.golden_record_id = new_entity["id"] # Linka o validation_record ao GR
-                        actions_summary["client_entity_created_or_updated"] = True
-                        logger.info(f"Novo Golden Record criado para cliente {main_document_normalized}. ID: {new_entity['id']}")
-                    else:
-                        logger.error(f"Falha ao criar novo Golden Record para {main_document_normalized}.")
+                    logger.error("Falha ao criar/atualizar Golden Record para %s.", main_document_normalized)
             else:
-                logger.warning(f"Não foi possível determinar o documento principal normalizado para criar/atualizar o Golden Record para o registro {record.id}. O registro não será um GR na tabela de entidades de cliente.")
+                logger.warning("Não foi possível determinar o documento principal normalizado para criar/atualizar o Golden Record para o registro %s. O registro não será um GR na tabela de entidades de cliente.", record.id)
                 record.is_golden_record = False # Se não tem documento principal, não pode ser GR
                 record.status_qualificacao = "UNQUALIFIED"
                 actions_summary["status_qualificacao_set"] = "UNQUALIFIED"
@@ -167,14 +155,14 @@ class DecisionRules:
                 scheduled_next_attempt_at=datetime.now(timezone.utc) + timedelta(days=1) # Agendar para amanhã
             )
             await self.qualification_repo.create_pending_qualification(pending_rec)
-            logger.info(f"Registro {record.id} marcado como PENDING_REVALIDATION e adicionado à fila de qualificações pendentes.")
+            logger.info("Registro %s marcado como PENDING_REVALIDATION e adicionado à fila de qualificações pendentes.", record.id)
 
         else:
             # Não é Golden Record e não vai para pendente (inválido ou inconsistente)
             record.is_golden_record = False
             record.status_qualificacao = "UNQUALIFIED"
             actions_summary["status_qualificacao_set"] = "UNQUALIFIED"
-            logger.info(f"Registro {record.id} marcado como UNQUALIFIED.")
+            logger.info("Registro %s marcado como UNQUALIFIED.", record.id)
             # O microserviço de revalidação moveria para inválidos após 20 dias,
             # ou uma regra mais rígida aqui poderia mover direto para inválidos
             # se a falha for crítica e não revalidável (ex: CPF com checksum inválido).
@@ -188,6 +176,32 @@ class DecisionRules:
 
         return actions_summary
 
+    def resolve_trivial_decision(self, record: ValidationRecord) -> Optional[Dict[str, Any]]:
+        """
+        Resolve, antes da persistência, os casos em que apply_rules certamente terminaria em
+        UNQUALIFIED sem nenhum efeito colateral (sem Golden Record, sem fila de pendentes):
+        tipos diferentes de 'pessoa_completa' sem validações individuais de telefone.
+        Nesses casos já ajusta o registro em memória (gravado direto no INSERT, dispensando
+        o UPDATE final) e retorna o mesmo resumo que apply_rules retornaria; caso contrário retorna None.
+        """
+        if record.tipo_validacao == "pessoa_completa":
+            return None
+        individual_validations = (record.validation_details or {}).get("individual_validations", {})
+        if individual_validations.get("celular") or individual_validations.get("telefone_fixo"):
+            return None
+
+        _, golden_record_reasons = self._evaluate_golden_record_candidacy(record)
+        record.is_golden_record = False
+        record.status_qualificacao = "UNQUALIFIED"
+        return {
+            "is_golden_record_candidate": False,
+            "status_qualificacao_set": "UNQUALIFIED",
+            "moved_to_qualificacoes_pendentes_queue": False,
+            "moved_to_invalid_archive": False,
+            "client_entity_created_or_updated": False,
+            "reason": golden_record_reasons
+        }
+
     def _evaluate_golden_record_candidacy(self, record: ValidationRecord) -> (bool, List[str]):
         """
         Avalia se um ValidationRecord é um candidato a Golden Record com base
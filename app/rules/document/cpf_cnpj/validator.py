@@ -2,11 +2,31 @@
 
 import logging
 import re
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Tuple, Union
 from app.rules.base import BaseValidator # Ensure this import is correct
 
 logger = logging.getLogger(__name__)
 
+_NON_DIGIT_RE = re.compile(r'[^0-9]')
+_CPF_DIGITS_RE = re.compile(r'\d{11}')
+_CNPJ_DIGITS_RE = re.compile(r'\d{14}')
+
+# Pesos dos dígitos verificadores (tuplas imutáveis, criadas uma única vez)
+_CPF_WEIGHTS_1 = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+_CPF_WEIGHTS_2 = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+_CNPJ_WEIGHTS_1 = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+_CNPJ_WEIGHTS_2 = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+
+def _calculate_check_digit(digits: Tuple[int, ...], weights: Tuple[int, ...]) -> int:
+    """
+    Calcula um dígito verificador (módulo 11) a partir dos dígitos já convertidos para inteiros.
+    zip() limita a soma ao tamanho da tupla de pesos, dispensando fatiamentos.
+    """
+    remainder = sum(d * w for d, w in zip(digits, weights)) % 11
+    return 0 if remainder < 2 else 11 - remainder
+
+
 class CpfCnpjValidator(BaseValidator):
     """
     Validador para documentos CPF e CNPJ.
@@ -58,7 +78,7 @@ class CpfCnpjValidator(BaseValidator):
                             - "business_rule_applied": Detalhes da regra de negócio aplicada.
         """
         document_number = data
-        logger.info(f"Iniciando validação de documento: {document_number[:5] if isinstance(document_number, str) and len(document_number) > 5 else document_number}...")
+        logger.info("Iniciando validação de documento: %s...", document_number[:5] if isinstance(document_number, str) and len(document_number) > 5 else document_number)
 
         # 1. Verificação de Input Vazio ou Inválido
         if not isinstance(document_number, str) or not document_number.strip():
@@ -84,7 +104,7 @@ class CpfCnpjValidator(BaseValidator):
         
         validation_message = "Documento inválido."
         business_rule_code = self.RN_DOC002 # Default for invalid format
-        logger.debug(f"Documento normalizado: {normalized_document}, é CPF: {is_cpf}, é CNPJ: {is_cnpj}")
+        logger.debug("Documento normalizado: %s, é CPF: %s, é CNPJ: %s", normalized_document, is_cpf, is_cnpj)
         
         details = {
             "document_type": None,
@@ -143,9 +163,9 @@ class CpfCnpjValidator(BaseValidator):
                 business_rule_applied={"code": business_rule_code, "type": "Documento - Validação Primária", "name": "Formato/Checksum Inválido"}
             )
         # Se o formato e o checksum forem válidos, prossegue para a consulta na base de dados
-        logger.info(f"{document_type} com formato e checksum válidos. Consultando base de dados cadastral...")
+        logger.info("%s com formato e checksum válidos. Consultando base de dados cadastral...", document_type)
         # Simulate querying the customer database
-        logger.debug(f"Consultando base de clientes para {document_type}: {normalized_document}")
+        logger.debug("Consultando base de clientes para %s: %s", document_type, normalized_document)
         customer_data = self.simulated_customer_database.get(normalized_document)
 
         if customer_data:
@@ -183,58 +203,44 @@ class CpfCnpjValidator(BaseValidator):
         """Remove caracteres não numéricos do documento."""
         if not document:
             return ""
-        return re.sub(r'[^0-9]', '', str(document))
+        return _NON_DIGIT_RE.sub('', str(document))
 
     def _validate_cpf_checksum(self, cpf: str) -> bool:
         """Valida o checksum de um CPF."""
-        if not re.fullmatch(r'\d{11}', cpf):
+        if not _CPF_DIGITS_RE.fullmatch(cpf):
             return False
 
         # Verifica se todos os dígitos são iguais (ex: '11111111111')
         if len(set(cpf)) == 1:
             return False
 
-        def calculate_digit(cpf_part: str, weight_start: int) -> int:
-            total_sum = 0
-            for i, digit in enumerate(cpf_part):
-                total_sum += int(digit) * (weight_start - i)
-            remainder = total_sum % 11
-            return 0 if remainder < 2 else 11 - remainder
+        # Converte os dígitos para inteiros uma única vez, reutilizados nos dois cálculos
+        digits = tuple(map(int, cpf))
 
-        digit1 = calculate_digit(cpf[:9], 10)
-        if digit1 != int(cpf[9]):
+        if _calculate_check_digit(digits, _CPF_WEIGHTS_1) != digits[9]:
             return False
 
-        digit2 = calculate_digit(cpf[:10], 11)
-        if digit2 != int(cpf[10]):
+        if _calculate_check_digit(digits, _CPF_WEIGHTS_2) != digits[10]:
             return False
 
         return True
 
     def _validate_cnpj_checksum(self, cnpj: str) -> bool:
         """Valida o checksum de um CNPJ."""
-        if not re.fullmatch(r'\d{14}', cnpj):
+        if not _CNPJ_DIGITS_RE.fullmatch(cnpj):
             return False
         
         # Verifica se todos os dígitos são iguais (ex: '11111111111111')
         if len(set(cnpj)) == 1:
             return False
 
-        def calculate_digit(cnpj_part: str, weights: list) -> int:
-            total_sum = 0
-            for i in range(len(cnpj_part)):
-                total_sum += int(cnpj_part[i]) * weights[i]
-            remainder = total_sum % 11
-            return 0 if remainder < 2 else 11 - remainder
+        # Converte os dígitos para inteiros uma única vez, reutilizados nos dois cálculos
+        digits = tuple(map(int, cnpj))
 
-        weights1 = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-        digit1 = calculate_digit(cnpj[:12], weights1)
-        if digit1 != int(cnpj[12]):
+        if _calculate_check_digit(digits, _CNPJ_WEIGHTS_1) != digits[12]:
             return False
 
-        weights2 = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-        digit2 = calculate_digit(cnpj[:13], weights2)
-        if digit2 != int(cnpj[13]):
+        if _calculate_check_digit(digits, _CNPJ_WEIGHTS_2) != digits[13]:
             return False
 
         return True
@@ -1,6 +1,7 @@
 # app/rules/email/validator.py
 
 import re
+import asyncio
 import logging
 from typing import Dict, Any, Optional
 
@@ -8,6 +9,9 @@ from app.rules.base import BaseValidator
 
 logger = logging.getLogger(__name__)
 
+_DOMAIN_RE = re.compile(r'@([^@]+)$')
+_BASIC_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+
 # --- Configuração e carregamento da biblioteca email_validator ---
 EMAIL_VALIDATOR_AVAILABLE = True
 try:
@@ -17,7 +21,7 @@ except ImportError:
     logger.warning("A biblioteca 'email_validator' não está instalada. A validação de e-mail será básica (apenas regex e blacklists).")
 except Exception as e:
     EMAIL_VALIDATOR_AVAILABLE = False
-    logger.error(f"Erro inesperado ao carregar ou configurar email_validator: {e}. Desativando.", exc_info=True)
+    logger.error("Erro inesperado ao carregar ou configurar email_validator: %s. Desativando.", e, exc_info=True)
 
 # --- Regras em Memória (Fallback e Heurísticas) ---
 # Você pode expandir estas listas conforme necessário
@@ -107,7 +111,7 @@ class EmailValidator(BaseValidator): # Herda de BaseValidator
         initial_details["input_data_cleaned"] = normalized_email
 
         # Extrai o domínio para verificações posteriores
-        domain_match = re.search(r'@([^@]+)$', normalized_email)
+        domain_match = _DOMAIN_RE.search(normalized_email)
         domain = domain_match.group(1).lower() if domain_match else ""
 
         if not domain: # Se não encontrou um domínio, o formato é inválido
@@ -129,7 +133,8 @@ class EmailValidator(BaseValidator): # Herda de BaseValidator
             try:
                 # check_deliverability=True verifica registros MX e tentativa de conexão SMTP.
                 # Pode ser mais lento, mas torna a validação mais robusta.
-                valid_email_info = validate_email(normalized_email, check_deliverability=True)
+                # A consulta DNS é síncrona: executada em thread para não bloquear o loop de eventos.
+                valid_email_info = await asyncio.to_thread(validate_email, normalized_email, check_deliverability=True)
                 is_syntax_valid = True
                 is_domain_resolvable = True
                 final_message = "E-mail válido e domínio resolvível (verificado por biblioteca 'email_validator')."
@@ -160,17 +165,17 @@ class EmailValidator(BaseValidator): # Herda de BaseValidator
                     business_rule_applied={"code": final_rule_code, "type": "Email - Validação Primária", "name": "Falha na Validação Principal de Email"}
                 )
             except Exception as e: # Captura outros erros inesperados da biblioteca
-                logger.error(f"Erro inesperado com 'email_validator' para '{normalized_email}': {e}", exc_info=True)
+                logger.error("Erro inesperado com 'email_validator' para '%s': %s", normalized_email, e, exc_info=True)
                 final_message = f"Erro interno na validação de e-mail: {e}. Revertendo para validação básica."
                 initial_details["validation_details"]["unexpected_error"] = str(e)
                 # Fallback para regex se a biblioteca falhar inesperadamente
-                is_syntax_valid = re.match(r"[^@]+@[^@]+\.[^@]+", normalized_email) is not None
+                is_syntax_valid = _BASIC_EMAIL_RE.match(normalized_email) is not None
                 is_domain_resolvable = True # Assume válido para as próximas checagens, já que a lib falhou
                 final_rule_code = self.RN_EMAIL_INVALID_FORMAT # Ainda é um problema de formato, mas devido a erro interno
 
         # Fallback para regex básica se 'email_validator' não estiver disponível ou falhou inesperadamente
         if not EMAIL_VALIDATOR_AVAILABLE or not is_syntax_valid: # Usa is_syntax_valid do bloco anterior
-            is_syntax_valid = re.match(r"[^@]+@[^@]+\.[^@]+", normalized_email) is not None
+            is_syntax_valid = _BASIC_EMAIL_RE.match(normalized_email) is not None
             initial_details["validation_details"]["is_syntax_valid_regex"] = is_syntax_valid
             if not is_syntax_valid:
                 return self._format_result(
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional, Union # Adicionada Union
 from app.rules.base import BaseValidator
@@ -70,85 +71,47 @@ class PessoaFullValidacao(BaseValidator): # Classe renomeada
         # No entanto, vamos preferir acessar como atributo e usar getattr para segurança
         # data_dict = data.model_dump() if isinstance(data, BaseModel) else data
 
+        # Monta a lista de sub-validações a executar. Cada item guarda a chave do resultado,
+        # a mensagem de falha e a corrotina do validador. As sub-validações são independentes
+        # entre si e são executadas em paralelo com asyncio.gather; a montagem do resultado
+        # segue a ordem abaixo, preservando a mensagem final do último campo inválido.
+        pending_validations = []
+
         # Validação de Nome
         # Acessa como atributo, com fallback para None se não existir
         nome = getattr(data, "nome", None)
         if nome is not None:
-            nome_result = await self.nome_validator.validate(nome)
-            results["details"]["individual_validations"]["nome"] = nome_result
-            if not nome_result.get("is_valid"):
-                results["is_valid"] = False
-                results["overall_message"] = "Validação de nome falhou."
-            else:
-                results["normalized_data"]["nome"] = nome_result.get("dado_normalizado")
-
+            pending_validations.append(("nome", "Validação de nome falhou.", self.nome_validator.validate(nome)))
 
         # Validação de CPF
         cpf = getattr(data, "cpf", None)
         if cpf is not None:
-            cpf_result = await self.cpf_cnpj_validator.validate(cpf)
-            results["details"]["individual_validations"]["cpf"] = cpf_result
-            if not cpf_result.get("is_valid"):
-                results["is_valid"] = False
-                results["overall_message"] = "Validação de CPF falhou."
-            else:
-                results["normalized_data"]["cpf"] = cpf_result.get("dado_normalizado")
-
+            pending_validations.append(("cpf", "Validação de CPF falhou.", self.cpf_cnpj_validator.validate(cpf)))
 
         # Validação de RG
         rg = getattr(data, "rg", None)
         if rg is not None:
-            rg_result = await self.rg_validator.validate(rg)
-            results["details"]["individual_validations"]["rg"] = rg_result
-            if not rg_result.get("is_valid"):
-                results["is_valid"] = False
-                results["overall_message"] = "Validação de RG falhou."
-            else:
-                results["normalized_data"]["rg"] = rg_result.get("dado_normalizado")
+            pending_validations.append(("rg", "Validação de RG falhou.", self.rg_validator.validate(rg)))
 
         # Validação de Data de Nascimento
         data_nasc = getattr(data, "data_nasc", None)
         if data_nasc is not None:
-            data_nasc_result = await self.data_nascimento_validator.validate(data_nasc)
-            results["details"]["individual_validations"]["data_nascimento"] = data_nasc_result
-            if not data_nasc_result.get("is_valid"):
-                results["is_valid"] = False
-                results["overall_message"] = "Validação de data de nascimento falhou."
-            else:
-                results["normalized_data"]["data_nascimento"] = data_nasc_result.get("dado_normalizado")
+            pending_validations.append(("data_nascimento", "Validação de data de nascimento falhou.", self.data_nascimento_validator.validate(data_nasc)))
 
         # Validação de Gênero/Sexo
         sexo = getattr(data, "sexo", None)
         if sexo is not None:
-            sexo_result = await self.sexo_validator.validate(sexo)
-            results["details"]["individual_validations"]["sexo"] = sexo_result
-            if not sexo_result.get("is_valid"):
-                results["is_valid"] = False
-                results["overall_message"] = "Validação de gênero/sexo falhou."
-            else:
-                results["normalized_data"]["sexo"] = sexo_result.get("dado_normalizado")
+            pending_validations.append(("sexo", "Validação de gênero/sexo falhou.", self.sexo_validator.validate(sexo)))
 
         # Validação de Email
         email = getattr(data, "email", None)
         if email is not None:
-            email_result = await self.email_validator.validate(email)
-            results["details"]["individual_validations"]["email"] = email_result
-            if not email_result.get("is_valid"):
-                results["is_valid"] = False
-                results["overall_message"] = "Validação de email falhou."
-            else:
-                results["normalized_data"]["email"] = email_result.get("dado_normalizado")
+            pending_validations.append(("email", "Validação de email falhou.", self.email_validator.validate(email)))
 
         # Validação de CEP
         cep = getattr(data, "cep", None)
         if cep is not None:
-            cep_result = await self.cep_validator.validate(cep)
-            results["details"]["individual_validations"]["cep"] = cep_result
-            if not cep_result.get("is_valid"):
-                results["is_valid"] = False
-                results["overall_message"] = "Validação de CEP falhou."
-            else:
-                results["normalized_data"]["cep"] = cep_result.get("dado_normalizado")
+            pending_validations.append(("cep", "Validação de CEP falhou.", self.cep_validator.validate(cep)))
 
         # Validação de Endereço (pode precisar de mais campos do dict)
         endereco_completo = {
@@ -163,38 +126,30 @@ class PessoaFullValidacao(BaseValidator): # Classe renomeada
         endereco_completo = {k: v for k, v in endereco_completo.items() if v is not None}
 
         if endereco_completo: # Verifica se há dados para validar o endereço
-            address_result = await self.address_validator.validate(endereco_completo)
-            results["details"]["individual_validations"]["endereco"] = address_result
-            if not address_result.get("is_valid"):
-                results["is_valid"] = False
-                results["overall_message"] = "Validação de endereço falhou."
-            else:
-                results["normalized_data"]["endereco"] = address_result.get("dado_normalizado")
-
+            pending_validations.append(("endereco", "Validação de endereço falhou.", self.address_validator.validate(endereco_completo)))
 
         # Validação de Telefone Fixo
         telefone_fixo = getattr(data, "telefone_fixo", None)
         if telefone_fixo is not None:
             # Passa o client_identifier para o validador de telefone, se existir
-            phone_fixo_result = await self.phone_validator.validate(telefone_fixo, client_identifier=client_identifier)
-            results["details"]["individual_validations"]["telefone_fixo"] = phone_fixo_result
-            if not phone_fixo_result.get("is_valid"):
-                results["is_valid"] = False
-                results["overall_message"] = "Validação de telefone fixo falhou."
-            else:
-                results["normalized_data"]["telefone_fixo"] = phone_fixo_result.get("dado_normalizado")
+            pending_validations.append(("telefone_fixo", "Validação de telefone fixo falhou.", self.phone_validator.validate(telefone_fixo, client_identifier=client_identifier)))
 
         # Validação de Celular
         celular = getattr(data, "celular", None)
         if celular is not None:
             # Passa o client_identifier para o validador de telefone, se existir
-            celular_result = await self.phone_validator.validate(celular, client_identifier=client_identifier)
-            results["details"]["individual_validations"]["celular"] = celular_result
-            if not celular_result.get("is_valid"):
+            pending_validations.append(("celular", "Validação de celular falhou.", self.phone_validator.validate(celular, client_identifier=client_identifier)))
+
+        # Executa todas as sub-validações concorrentemente: a latência total passa a ser a do validador mais lento
+        sub_results = await asyncio.gather(*(coro for _, _, coro in pending_validations))
+
+        for (field_key, failure_message, _), field_result in zip(pending_validations, sub_results):
+            results["details"]["individual_validations"][field_key] = field_result
+            if not field_result.get("is_valid"):
                 results["is_valid"] = False
-                results["overall_message"] = "Validação de celular falhou."
+                results["overall_message"] = failure_message
             else:
-                results["normalized_data"]["celular"] = celular_result.get("dado_normalizado")
+                results["normalized_data"][field_key] = field_result.get("dado_normalizado")
         
         # Consolida dado normalizado (opcional, pode ser o CPF normalizado ou uma combinação)
         if results["is_valid"] and results["overall_message"] == "Validação de pessoa concluída.":
@@ -36,7 +36,7 @@ class DataNascimentoValidator(BaseValidator):
         super().__init__(origin_name="data_nascimento_validator")
         self.expected_format = expected_format
         self.min_age = min_age
-        logger.info(f"DataNascimentoValidator inicializado com formato esperado: {self.expected_format}.")
+        logger.info("DataNascimentoValidator inicializado com formato esperado: %s.", self.expected_format)
 
     async def validate(self, data: Any, **kwargs) -> Dict[str, Any]:
         """
@@ -50,7 +50,7 @@ class DataNascimentoValidator(BaseValidator):
             Dict[str, Any]: Um dicionário com o resultado da validação padronizado.
         """
         data_nasc_str = data
-        logger.info(f"Iniciando validação de data de nascimento: {data_nasc_str}...")
+        logger.info("Iniciando validação de data de nascimento: %s...", data_nasc_str)
 
         # 1. Verificação de Input Vazio ou Inválido
         if not isinstance(data_nasc_str, str) or not data_nasc_str.strip():
@@ -112,7 +112,7 @@ class DataNascimentoValidator(BaseValidator):
             details["reason"].append("invalid_format_parsing")
             is_valid = False
         except Exception as e:
-            logger.error(f"Erro inesperado na validação de data de nascimento para '{data_nasc_str}': {e}", exc_info=True)
+            logger.error("Erro inesperado na validação de data de nascimento para '%s': %s", data_nasc_str, e, exc_info=True)
             message = f"Erro inesperado durante a validação da data de nascimento: {e}."
             business_rule_code = self.VAL_GENERIC_INVALID # Usar código genérico de inválido
             details["reason"].append("unexpected_error")
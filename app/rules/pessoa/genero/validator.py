@@ -18,7 +18,7 @@ class SexoValidator(BaseValidator):
     def __init__(self, allowed_genders: Optional[List[str]] = None):
         super().__init__(origin_name="sexo_validator")
         self.allowed_genders = [g.upper() for g in allowed_genders] if allowed_genders else ["MASCULINO", "FEMININO", "OUTRO", "NAO INFORMADO"]
-        logger.info(f"SexoValidator inicializado com gêneros permitidos: {self.allowed_genders}.")
+        logger.info("SexoValidator inicializado com gêneros permitidos: %s.", self.allowed_genders)
 
     async def validate(self, data: Any, **kwargs) -> Dict[str, Any]:
         """
@@ -32,7 +32,7 @@ class SexoValidator(BaseValidator):
             Dict[str, Any]: Um dicionário com o resultado da validação padronizado.
         """
         gender_input = data
-        logger.info(f"Iniciando validação de gênero: {gender_input}...")
+        logger.info("Iniciando validação de gênero: %s...", gender_input)
 
         # 1. Verificação de Input Vazio ou Inválido
         if not isinstance(gender_input, str) or not gender_input.strip():
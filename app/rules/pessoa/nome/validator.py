@@ -7,6 +7,8 @@ from app.rules.base import BaseValidator # Importa a classe BaseValidator
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r'\s+')
+
 class NomeValidator(BaseValidator):
     """
     Validador de nomes de pessoas.
@@ -40,7 +42,7 @@ class NomeValidator(BaseValidator):
             )
         
         # Remove múltiplos espaços em branco e capitaliza cada palavra
-        normalized_name = re.sub(r'\s+', ' ', nome).strip().title()
+        normalized_name = _WHITESPACE_RE.sub(' ', nome).strip().title()
         
         # Validação básica: verifica se o nome tem pelo menos duas partes (nome e sobrenome)
         # Esta é uma regra comum, mas pode ser ajustada conforme a necessidade.
@@ -54,7 +56,7 @@ class NomeValidator(BaseValidator):
             code = self.VAL_GENERIC_INVALID
             normalized_name = None # Não normaliza se o nome for considerado inválido
 
-        logger.debug(f"Validação de nome para '{nome}': {message}")
+        logger.debug("Validação de nome para '%s': %s", nome, message)
         
         return self._format_result(
             is_valid=is_valid,
@@ -7,6 +7,9 @@ from app.rules.base import BaseValidator
 
 logger = logging.getLogger(__name__)
 
+_NON_DIGIT_RE = re.compile(r'\D')
+_RG_DIGITS_RE = re.compile(r'\d{8,9}')
+
 class RGValidator(BaseValidator):
     """
     Validador para números de Registro Geral (RG) em um formato simplificado.
@@ -43,7 +46,7 @@ class RGValidator(BaseValidator):
             Dict[str, Any]: Um dicionário com o resultado da validação padronizado.
         """
         rg_number = data
-        logger.info(f"Iniciando validação de RG: {rg_number[:5] if isinstance(rg_number, str) and len(rg_number) > 5 else rg_number}...")
+        logger.info("Iniciando validação de RG: %s...", rg_number[:5] if isinstance(rg_number, str) and len(rg_number) > 5 else rg_number)
 
         # 1. Verificação de Input Vazio ou Inválido
         if not isinstance(rg_number, str) or not rg_number.strip():
@@ -74,7 +77,7 @@ class RGValidator(BaseValidator):
 
         # Validação de formato básico (números e comprimento típico)
         # Assumindo RGs de 8 ou 9 dígitos para esta simulação (ex: 12.345.678-9)
-        if re.fullmatch(r'^\d{8,9}$', normalized_rg):
+        if _RG_DIGITS_RE.fullmatch(normalized_rg):
             is_valid_format = True
             details["is_valid_format"] = True
             if len(set(normalized_rg)) == 1:
@@ -104,7 +107,7 @@ class RGValidator(BaseValidator):
             )
 
         # Se o formato e checksum (simulado) forem válidos, prossegue para a consulta na base de dados
-        logger.info(f"RG com formato válido. Consultando base de dados cadastral simulada para RG: {normalized_rg}")
+        logger.info("RG com formato válido. Consultando base de dados cadastral simulada para RG: %s", normalized_rg)
         customer_data = self.simulated_rg_database.get(normalized_rg)
 
         is_valid_final = False
@@ -141,4 +144,4 @@ class RGValidator(BaseValidator):
         if not rg:
             return ""
         # Remove pontos, traços e outros caracteres não numéricos
-        return re.sub(r'\D', '', str(rg))
+        return _NON_DIGIT_RE.sub('', str(rg))
@@ -20,6 +20,9 @@ except Exception as e:
 
 logger = logging.getLogger(__name__)
 
+# Fallback sem phonenumbers: '+' opcional e 8 a 20 dígitos, espaços, hífens ou parênteses
+_BASIC_PHONE_RE = re.compile(r'\+?[0-9\s\-\(\)]{8,20}')
+
 # Códigos de Regra específicos para validação de Telefone (Padronização RN_TELxxx)
 class PhoneRuleCodes:
     RN_TEL001 = "RN_TEL001" # Telefone válido e reconhecido (formato e tipo)
@@ -182,7 +185,7 @@ class PhoneValidator(BaseValidator):
                 business_rule_code = PhoneRuleCodes.RN_TEL002
                 details["reason"].append(f"parsing_error: {e.args[0].name}")
             except Exception as e:
-                logger.error(f"Erro inesperado no phonenumbers para '{normalized_phone}': {e}", exc_info=True)
+                logger.error("Erro inesperado no phonenumbers para '%s': %s", normalized_phone, e, exc_info=True)
                 message = f"Erro inesperado durante a validação do telefone: {e}. Revertendo para validação básica."
                 is_valid = False # Considera inválido em caso de erro interno
                 business_rule_code = PhoneRuleCodes.RN_TEL009
@@ -190,7 +193,7 @@ class PhoneValidator(BaseValidator):
         else: # phonenumbers não disponível, fallback para regex
             # Regex básica para validação de telefone (muito simplificada)
             # Adapte esta regex para suas necessidades específicas de formato!
-            if re.fullmatch(r'^\+?[0-9\s\-\(\)]{8,20}$', normalized_phone):
+            if _BASIC_PHONE_RE.fullmatch(normalized_phone):
                 is_valid = True
                 message = "Número de telefone válido (formato básico via regex). Validação avançada desativada."
                 business_rule_code = PhoneRuleCodes.RN_TEL001
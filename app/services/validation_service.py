@@ -1,11 +1,18 @@
 # app/services/validation_service.py
 
+import asyncio
+import contextvars
 import logging
+import time
+from collections import Counter
+from functools import partial
+from types import MappingProxyType
 import asyncpg
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, AsyncIterator, Awaitable, Callable, List, Union
 from datetime import datetime, timezone
 import uuid # Para manipulação de UUIDs
-import json # Para json.dumps
+import json # Formato persistido de dado_original/dado_normalizado (separadores e escapes do json da stdlib)
+import orjson # Serialização JSON (mais rápida que o json da stdlib)
 from pydantic import BaseModel
 from app.auth.api_key_manager import APIKeyManager
 from app.database.repositories.validation_record_repository import ValidationRecordRepository
@@ -24,11 +31,29 @@ from app.rules.pessoa.genero.validator import SexoValidator
 from app.rules.pessoa.rg.validator import RGValidator
 from app.rules.pessoa.data_nascimento.validator import DataNascimentoValidator
 from app.rules.pessoa.composite_validator import PessoaFullValidacao
+from app.utils.ttl_cache import TTLCache
 
 # CONSTANTES DE MENSAGEM (para consistência)
-API_KEY_INVALID_MESSAGE = "API Key inválida ou não autorizada."
 INTERNAL_SERVER_ERROR_MESSAGE = "Ocorreu um erro interno inesperado."
 
+# Cache de resultados dos validadores para chaves (validation_type, client_identifier, data) repetidas
+VALIDATION_RESULT_CACHE_MAXSIZE = 50_000
+VALIDATION_RESULT_CACHE_TTL_SECONDS = 60
+
+# Gravação de logs de auditoria em lote: até N entradas ou após uma janela curta de espera
+LOG_BATCH_MAX_SIZE = 100
+LOG_BATCH_MAX_WAIT_SECONDS = 0.05
+# Limite da fila de logs: com o banco lento ou fora do ar, entradas além desse total são descartadas (com log)
+LOG_QUEUE_MAX_SIZE = 10_000
+
+# Amostragem dos logs de erro de validate_data: por janela, apenas as primeiras N ocorrências de cada
+# (validation_type, tipo de exceção) registram traceback e payload completos; as demais geram log resumido
+ERROR_LOG_SAMPLE_WINDOW_SECONDS = 60
+ERROR_LOG_MAX_DETAILED_PER_WINDOW = 10
+
+# Mapeamento vazio compartilhado (somente leitura) para campos opcionais ausentes nos resultados
+_EMPTY_MAPPING: "MappingProxyType[str, Any]" = MappingProxyType({})
+
 logger = logging.getLogger(__name__)
 
 class ValidationService:
@@ -37,6 +62,26 @@ class ValidationService:
     Responsável por rotear as requisições para o validador correto,
     aplicar regras de negócio, persistir resultados e gerenciar Golden Records.
     """
+    # Atributos fixos definidos em __init__: acesso por slot, sem __dict__ por instância
+    __slots__ = (
+        "api_key_manager",
+        "repo",
+        "qualification_repo",
+        "decision_rules",
+        "log_repo",
+        "pessoa_full_validacao_validator",
+        "validators",
+        "_validate_fns",
+        "_log_queue",
+        "_log_writer_task",
+        "_dropped_log_count",
+        "_log_entry_factories",
+        "_validation_result_cache",
+        "_inflight_validations",
+        "_error_log_counts",
+        "_error_log_window_start",
+    )
+
     def __init__(
         self,
         api_key_manager: APIKeyManager,
@@ -89,60 +134,245 @@ class ValidationService:
             "data_nascimento": data_nascimento_validator,
             "pessoa_completa": self.pessoa_full_validacao_validator 
         }
+        # Métodos 'validate' já vinculados, resolvidos uma única vez para o despacho em validate_data.
+        # Exposto como MappingProxyType: visão somente leitura, sem cópia, com o mesmo custo de lookup de um dict.
+        self._validate_fns: "MappingProxyType[str, Callable[..., Awaitable[Dict[str, Any]]]]" = MappingProxyType({
+            validation_type: validator.validate for validation_type, validator in self.validators.items()
+        })
+        # Fila de logs de auditoria, esvaziada em lote por uma tarefa em segundo plano
+        self._log_queue: "asyncio.Queue[LogEntry]" = asyncio.Queue(maxsize=LOG_QUEUE_MAX_SIZE)
+        self._log_writer_task: Optional[asyncio.Task] = None
+        self._dropped_log_count = 0 # Total de logs descartados por fila cheia
+        # Fábricas de LogEntry por app_name, criadas sob demanda (ver _get_log_entry_factory)
+        self._log_entry_factories: Dict[str, Callable[..., LogEntry]] = {}
+        # Resultados recentes dos validadores, indexados por (validation_type, client_identifier, data canônico)
+        self._validation_result_cache = TTLCache(
+            maxsize=VALIDATION_RESULT_CACHE_MAXSIZE,
+            ttl_seconds=VALIDATION_RESULT_CACHE_TTL_SECONDS
+        )
+        # Validações em andamento por chave de cache: requisições idênticas simultâneas aguardam o mesmo resultado
+        self._inflight_validations: Dict[tuple, "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
+        # Contagem de erros por (validation_type, tipo de exceção) na janela de amostragem atual
+        self._error_log_counts: Counter = Counter()
+        self._error_log_window_start = time.monotonic()
         logger.info("ValidationService inicializado com todos os validadores e repositórios.")
 
-    async def validate_data(self, app_info: Dict[str, Any], request: UniversalValidationRequest) -> Dict[str, Any]:
+    def enqueue_log(self, log_entry: LogEntry) -> None:
         """
-        Orquestra o processo de validação de um dado específico.
+        Enfileira um log de auditoria sem bloquear a resposta da requisição.
+        A tarefa de escrita é iniciada sob demanda (precisa de um loop de eventos em execução).
+        Com a fila cheia (LOG_QUEUE_MAX_SIZE), a entrada é descartada e o descarte é registrado no log da aplicação.
         """
-        app_name_log = app_info.get('app_name', 'Desconhecido')
-        operator_id_log = request.operator_id or app_name_log
-        if not app_info or not app_info.get("is_active"):
-            logger.warning(f"Tentativa de validação com API Key inválida ou inativa: {app_name_log}...")
-            await self.log_repo.add_log_entry(
-                LogEntry(
-                    tipo_evento="AUTENTICACAO",
-                    app_origem=app_name_log,
-                    usuario_operador=operator_id_log,
-                    detalhes_evento_json={"app_name": app_name_log, "status": "failed"},
-                    status_operacao="FALHA",
-                    mensagem_log="Tentativa de validação com API Key inválida ou inativa.",
-                    client_entity_id_afetado=request.client_identifier 
+        try:
+            self._log_queue.put_nowait(log_entry)
+        except asyncio.QueueFull:
+            self._dropped_log_count += 1
+            # Amostrado como os erros de validate_data, para não inundar o log durante uma indisponibilidade do banco
+            if self._should_log_error_details(("audit_log_queue_full",)):
+                logger.warning(
+                    "Fila de logs de auditoria cheia (%s entradas): log '%s' descartado. Total descartado: %s.",
+                    LOG_QUEUE_MAX_SIZE, log_entry.tipo_evento, self._dropped_log_count
                 )
-            )
-            return {"status": "error", "message": API_KEY_INVALID_MESSAGE, "status_code": 401}
+        if self._log_writer_task is None or self._log_writer_task.done():
+            # Contexto vazio: a tarefa de escrita não deve herdar uma conexão vinculada por shared_connection()
+            self._log_writer_task = asyncio.create_task(self._drain_log_queue(), context=contextvars.Context())
 
-        logger.info(f"Requisição de validação recebida do app '{app_name_log}' para tipo '{request.validation_type}'.")
+    async def _drain_log_queue(self) -> None:
+        """
+        Consome a fila de logs continuamente, agrupando até LOG_BATCH_MAX_SIZE entradas
+        (ou o que chegar em LOG_BATCH_MAX_WAIT_SECONDS) em um único INSERT em lote.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._log_queue.get()]
+            deadline = loop.time() + LOG_BATCH_MAX_WAIT_SECONDS
+            while len(batch) < LOG_BATCH_MAX_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._log_queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._write_log_batch(batch)
+            finally:
+                for _ in batch:
+                    self._log_queue.task_done()
+
+    async def _write_log_batch(self, batch: List[LogEntry]) -> None:
+        """
+        Grava um lote de logs com um único INSERT em lote. Se o lote falhar (o executemany é atômico),
+        grava entrada por entrada, para que uma linha inválida ou uma falha momentânea não descarte o lote inteiro.
+        """
+        if await self.log_repo.add_log_entries_bulk(batch):
+            return
+        logger.warning("Falha ao gravar lote de %s logs de auditoria; gravando individualmente.", len(batch))
+        lost_count = 0
+        for log_entry in batch:
+            if await self.log_repo.add_log_entry(log_entry) is None:
+                lost_count += 1
+        if lost_count:
+            logger.error("%s de %s logs de auditoria do lote não puderam ser gravados e foram perdidos.", lost_count, len(batch))
+
+    async def flush_logs(self) -> None:
+        """
+        Aguarda a gravação de todos os logs enfileirados e encerra a tarefa de escrita.
+        Deve ser chamado no shutdown da aplicação, antes de fechar o pool de conexões.
+        """
+        if self._log_writer_task is None:
+            return
+        if not self._log_writer_task.done():
+            await self._log_queue.join()
+            self._log_writer_task.cancel()
+        try:
+            await self._log_writer_task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error("Tarefa de gravação de logs encerrada com erro: %s", e, exc_info=True)
+        self._log_writer_task = None
+        logger.info("Logs de auditoria pendentes gravados.")
+
+    def _get_log_entry_factory(self, app_info: Dict[str, Any]) -> Callable[..., LogEntry]:
+        """
+        Retorna uma fábrica de LogEntry com 'app_origem' já fixado para a aplicação.
+        Usa model_construct: os campos são montados pelo próprio serviço e não precisam de validação.
+        A fábrica é criada uma única vez por aplicação e guardada no próprio serviço
+        (o app_info pertence ao APIKeyManager e não é alterado).
+        """
+        app_name = app_info.get("app_name", "Desconhecido")
+        factory = self._log_entry_factories.get(app_name)
+        if factory is None:
+            factory = partial(LogEntry.model_construct, app_origem=app_name)
+            self._log_entry_factories[app_name] = factory
+        return factory
+
+    def _should_log_error_details(self, error_key: tuple) -> bool:
+        """
+        Indica se o erro identificado por 'error_key' ainda deve ser registrado com detalhes
+        (traceback e payload) na janela atual. Em uma rajada de falhas idênticas, apenas as
+        primeiras ERROR_LOG_MAX_DETAILED_PER_WINDOW ocorrências pagam esse custo.
+        """
+        now = time.monotonic()
+        if now - self._error_log_window_start >= ERROR_LOG_SAMPLE_WINDOW_SECONDS:
+            self._error_log_counts.clear()
+            self._error_log_window_start = now
+        self._error_log_counts[error_key] += 1
+        return self._error_log_counts[error_key] <= ERROR_LOG_MAX_DETAILED_PER_WINDOW
+
+    def _validation_cache_key(self, validation_type: str, client_identifier: Optional[str], data: Any) -> tuple:
+        """
+        Monta a chave do cache de resultados: tipo de validação + client_identifier + dados serializados
+        com chaves ordenadas, para que payloads equivalentes (mesmos campos em ordem diferente) compartilhem
+        a mesma entrada. O client_identifier é repassado aos validadores (ex.: PhoneValidator o usa em logs
+        e regras), portanto o resultado de um cliente nunca é reaproveitado para outro.
+        """
+        return (validation_type, client_identifier, orjson.dumps(data, option=orjson.OPT_SORT_KEYS, default=str))
 
-        validator = self.validators.get(request.validation_type)
-        if not validator:
-            logger.warning(f"Tipo de validação '{request.validation_type}' não suportado.")
-            await self.log_repo.add_log_entry(
-                LogEntry(
+    async def _validate_single_flight(self, cache_key: tuple, validate_fn: Callable[..., Awaitable[Dict[str, Any]]], request: UniversalValidationRequest) -> Dict[str, Any]:
+        """
+        Executa o validador uma única vez para requisições idênticas simultâneas (mesma chave de cache).
+        A primeira executa o validador e grava o resultado no cache; as demais aguardam o mesmo Future.
+        Se a execução original falhar, cada requisição em espera executa o validador por conta própria.
+        """
+        inflight = self._inflight_validations.get(cache_key)
+        if inflight is not None:
+            # shield: o cancelamento de uma requisição em espera não cancela o Future compartilhado
+            shared_result = await asyncio.shield(inflight)
+            if shared_result is not None:
+                logger.debug("Resultado de validação do tipo '%s' compartilhado com requisição simultânea.", request.validation_type)
+                return shared_result
+            return await validate_fn(request.data, client_identifier=request.client_identifier)
+
+        future: "asyncio.Future[Optional[Dict[str, Any]]]" = asyncio.get_running_loop().create_future()
+        self._inflight_validations[cache_key] = future
+        validation_result = None
+        try:
+            validation_result = await validate_fn(request.data, client_identifier=request.client_identifier)
+            self._validation_result_cache.set(cache_key, validation_result)
+            return validation_result
+        finally:
+            # Em caso de falha (inclusive cancelamento) sinaliza None: quem aguarda executa o validador
+            self._inflight_validations.pop(cache_key, None)
+            future.set_result(validation_result)
+
+    async def validate_data(self, app_info: Dict[str, Any], request: UniversalValidationRequest) -> Union[ValidationResponse, Dict[str, Any]]:
+        """
+        Orquestra o processo de validação de um dado específico.
+        'app_info' já chega autenticado e ativo (dependência require_active_app).
+        Em caso de sucesso retorna o próprio ValidationResponse (serializado uma única vez pelo FastAPI);
+        em caso de erro retorna um dicionário com 'status', 'message' e 'status_code'.
+        """
+        app_name_log = app_info.get('app_name', 'Desconhecido')
+        operator_id_log = request.operator_id or app_name_log
+        # Um único timestamp por requisição, compartilhado por todas as entradas de log dela
+        request_ts = datetime.now(timezone.utc)
+        make_log = partial(self._get_log_entry_factory(app_info), timestamp_evento=request_ts, created_at=request_ts)
+
+        logger.info("Requisição de validação recebida do app '%s' para tipo '%s'.", app_name_log, request.validation_type)
+
+        # request.data é convertido para dict uma única vez e reutilizado na chave de cache,
+        # no dado_original e nos logs. Dados que não são modelo nem dict seguem como string.
+        if isinstance(request.data, BaseModel):
+            request_data_dump = request.data.model_dump()
+        elif isinstance(request.data, dict):
+            request_data_dump = request.data
+        else:
+            request_data_dump = str(request.data)
+
+        validate_fn = self._validate_fns.get(request.validation_type)
+        if not validate_fn:
+            logger.warning("Tipo de validação '%s' não suportado.", request.validation_type)
+            unsupported_message = f"Tipo de validação '{request.validation_type}' não suportado." # Usada no log e na resposta
+            self.enqueue_log(
+                make_log(
                     tipo_evento="VALIDACAO_DADO",
-                    app_origem=app_name_log,
                     usuario_operador=operator_id_log,
-                    detalhes_evento_json={"validation_type": request.validation_type, "data": request.data.model_dump() if hasattr(request.data, 'model_dump') else request.data}, 
+                    detalhes_evento_json={"validation_type": request.validation_type, "data": request_data_dump}, 
                     status_operacao="FALHA",
-                    mensagem_log=f"Tipo de validação '{request.validation_type}' não suportado.",
+                    mensagem_log=unsupported_message,
                     client_entity_id_afetado=request.client_identifier 
                 )
             )
-            return {"status": "error", "message": f"Tipo de validação '{request.validation_type}' não suportado.", "status_code": 400}
+            return {"status": "error", "message": unsupported_message, "status_code": 400}
 
         try:
             # Passa todos os dados brutos e o client_identifier para o validador
             # Se for um validador composto (pessoa_completa), ele saberá como lidar com o dict.
             # Se for um validador simples (telefone), ele espera que request.data contenha o dado do telefone.
-            validation_result = await validator.validate(request.data, client_identifier=request.client_identifier)
+            # O resultado do validador é reaproveitado do cache quando o mesmo dado foi validado recentemente.
+            # A persistência, as regras de decisão e o log continuam sendo executados a cada requisição.
+            cache_key = self._validation_cache_key(request.validation_type, request.client_identifier, request_data_dump)
+            validation_result = None if request.cache_bypass else self._validation_result_cache.get(cache_key)
+            if request.cache_bypass:
+                validation_result = await validate_fn(request.data, client_identifier=request.client_identifier)
+                self._validation_result_cache.set(cache_key, validation_result)
+            elif validation_result is None:
+                # Requisições idênticas simultâneas compartilham uma única execução do validador
+                validation_result = await self._validate_single_flight(cache_key, validate_fn, request)
+            else:
+                logger.debug("Resultado de validação do tipo '%s' obtido do cache.", request.validation_type)
 
-            # Converte dado_original para string se for um objeto ou dicionário
-            original_data_str = json.dumps(request.data.model_dump()) if isinstance(request.data, BaseModel) else json.dumps(request.data) if isinstance(request.data, dict) else str(request.data)
+            # Converte dado_original para string a partir do dict já extraído. Usa json.dumps (e não orjson)
+            # para manter o mesmo formato das linhas já gravadas na coluna TEXT.
+            original_data_str = json.dumps(request_data_dump, default=str) if isinstance(request_data_dump, dict) else request_data_dump
             
-            # Ajusta dado_normalizado para string se for um dicionário (para compatibilidade com VARCHAR)
-            normalized_data_str = json.dumps(validation_result.get("dado_normalizado")) if isinstance(validation_result.get("dado_normalizado"), dict) else str(validation_result.get("dado_normalizado"))
+            # Ajusta dado_normalizado para string se for um dicionário (para compatibilidade com a coluna TEXT).
+            # O valor é lido uma única vez e, quando já é string, é usado sem nova conversão.
+            normalized_data = validation_result.get("dado_normalizado")
+            if isinstance(normalized_data, str):
+                normalized_data_str = normalized_data
+            elif isinstance(normalized_data, dict):
+                normalized_data_str = json.dumps(normalized_data, default=str) # Mesmo formato das linhas já gravadas
+            else:
+                normalized_data_str = str(normalized_data)
+
+            # Regra de negócio aplicada pelo validador, lida uma única vez (validadores podem omiti-la)
+            business_rule = validation_result.get("business_rule_applied") or _EMPTY_MAPPING
 
-            record = ValidationRecord(
+            # Registro montado a partir de dados do próprio serviço/validadores: dispensa validação do Pydantic
+            record = ValidationRecord.model_construct(
                 dado_original=original_data_str,
                 dado_normalizado=normalized_data_str,
                 is_valido=validation_result.get("is_valid"),
@@ -152,104 +382,105 @@ class ValidationService:
                 app_name=app_name_log,
                 client_identifier=request.client_identifier,
                 validation_details=validation_result.get("details", {}),
-                regra_negocio_codigo=validation_result.get("business_rule_applied", {}).get("code"),
-                regra_negocio_descricao=validation_result.get("business_rule_applied", {}).get("description"),
-                regra_negocio_tipo=validation_result.get("business_rule_applied", {}).get("type"),
-                regra_negocio_parametros=validation_result.get("business_rule_applied", {}).get("parameters"),
+                regra_negocio_codigo=business_rule.get("code"),
+                regra_negocio_descricao=business_rule.get("description"),
+                regra_negocio_tipo=business_rule.get("type"),
+                regra_negocio_parametros=business_rule.get("parameters"),
                 usuario_criacao=operator_id_log,
                 usuario_atualizacao=operator_id_log,
                 is_golden_record=False, # Definido inicialmente como False, DecisionRules irá atualizar
                 golden_record_id=None, # Definido inicialmente como None, DecisionRules irá atualizar
-                status_qualificacao="PENDING_DECISION", # NOVO: Status inicial para qualificação
+                status_qualificacao="PENDING_DECISION", # Status inicial; resolve_trivial_decision ou apply_rules definem o final
                 last_enrichment_attempt_at=None,
-                client_entity_id=request.client_identifier # Ou extraído de request.data se houver um campo 'cclub'
+                client_entity_id=request.client_identifier, # Ou extraído de request.data se houver um campo 'cclub'
+                # Reaproveita o timestamp da requisição em vez de três leituras do relógio pelos default_factory
+                data_validacao=request_ts,
+                created_at=request_ts,
+                updated_at=request_ts
             )
             
-            persisted_record = await self.repo.create_record(record)
-            if not persisted_record:
-                raise Exception("Falha ao persistir o registro de validação inicial.")
-
-            # Após a persistência, aplica as regras de decisão para qualificação
-            # A instância de `decision_rules` já tem `validation_repo` e `qualification_repo`
-            actions_summary = await self.decision_rules.apply_rules(persisted_record, app_info)
-
-            # Recarrega o registro para ter os campos atualizados pelo decision_rules
-            updated_persisted_record = await self.repo.get_record_by_id(persisted_record.id)
-            if not updated_persisted_record:
-                logger.error(f"Não foi possível recarregar o registro {persisted_record.id} após aplicação das regras de decisão.")
-                # Continua com o record original, mas pode haver inconsistência nos logs/resposta
-                updated_persisted_record = persisted_record 
-
-            # A resposta deve ser um dicionário que FastAPI pode converter para ValidationResponse
-            response_data = ValidationResponse(
-                id=updated_persisted_record.id,
-                dado_original=updated_persisted_record.dado_original,
-                dado_normalizado=updated_persisted_record.dado_normalizado,
-                is_valido=updated_persisted_record.is_valido,
-                mensagem=updated_persisted_record.mensagem,
-                origem_validacao=updated_persisted_record.origem_validacao,
-                tipo_validacao=updated_persisted_record.tipo_validacao,
-                app_name=updated_persisted_record.app_name,
-                client_identifier=updated_persisted_record.client_identifier,
-                short_id_alias=updated_persisted_record.short_id_alias,
-                validation_details=updated_persisted_record.validation_details,
-                data_validacao=updated_persisted_record.data_validacao,
-                regra_negocio_codigo=updated_persisted_record.regra_negocio_codigo,
-                regra_negocio_descricao=updated_persisted_record.regra_negocio_descricao,
-                regra_negocio_tipo=updated_persisted_record.regra_negocio_tipo,
-                regra_negocio_parametros=updated_persisted_record.regra_negocio_parametros,
-                is_golden_record=updated_persisted_record.is_golden_record,
-                golden_record_id=updated_persisted_record.golden_record_id,
-                status_qualificacao=updated_persisted_record.status_qualificacao,
-                last_enrichment_attempt_at=updated_persisted_record.last_enrichment_attempt_at,
-                client_entity_id=updated_persisted_record.client_entity_id,
+            # Quando o resultado das regras de decisão é certamente UNQUALIFIED e sem efeitos colaterais
+            # (caso comum dos tipos simples), o status final já vai no INSERT e apply_rules não é executado.
+            actions_summary = self.decision_rules.resolve_trivial_decision(record)
+            if actions_summary is not None:
+                # create_record relança erros do banco, tratados pelo except abaixo
+                persisted_record = await self.repo.create_record(record)
+            else:
+                # INSERT e regras de decisão usam a mesma conexão do pool (um único acquire/release por requisição)
+                async with self.repo.db_manager.shared_connection():
+                    persisted_record = await self.repo.create_record(record)
+
+                    # Após a persistência, aplica as regras de decisão para qualificação
+                    # A instância de `decision_rules` já tem `validation_repo` e `qualification_repo`
+                    actions_summary = await self.decision_rules.apply_rules(persisted_record, app_info)
+
+            # apply_rules atualiza em memória exatamente os campos que grava no banco
+            # (is_golden_record, status_qualificacao, golden_record_id), portanto o registro
+            # retornado pelo INSERT ... RETURNING * já reflete o estado final e não é preciso relê-lo.
+
+            # A resposta é devolvida como ValidationResponse: o FastAPI serializa o modelo uma única vez.
+            # model_construct evita revalidar dados que vêm do próprio registro persistido.
+            response_data = ValidationResponse.model_construct(
+                id=persisted_record.id,
+                dado_original=persisted_record.dado_original,
+                dado_normalizado=persisted_record.dado_normalizado,
+                is_valido=persisted_record.is_valido,
+                mensagem=persisted_record.mensagem,
+                origem_validacao=persisted_record.origem_validacao,
+                tipo_validacao=persisted_record.tipo_validacao,
+                app_name=persisted_record.app_name,
+                client_identifier=persisted_record.client_identifier,
+                short_id_alias=persisted_record.short_id_alias,
+                validation_details=persisted_record.validation_details,
+                data_validacao=persisted_record.data_validacao,
+                regra_negocio_codigo=persisted_record.regra_negocio_codigo,
+                regra_negocio_descricao=persisted_record.regra_negocio_descricao,
+                regra_negocio_tipo=persisted_record.regra_negocio_tipo,
+                regra_negocio_parametros=persisted_record.regra_negocio_parametros,
+                is_golden_record=persisted_record.is_golden_record,
+                golden_record_id=persisted_record.golden_record_id,
+                status_qualificacao=persisted_record.status_qualificacao,
+                last_enrichment_attempt_at=persisted_record.last_enrichment_attempt_at,
+                client_entity_id=persisted_record.client_entity_id,
                 status="success",
                 message="Validação e qualificação concluídas com sucesso.", # Mensagem atualizada
                 status_code=200
-            ).model_dump(mode='json') # Converter para dicionário para retorno consistente
+            )
 
-            await self.log_repo.add_log_entry(
-                LogEntry(
+            self.enqueue_log(
+                make_log(
                     tipo_evento="VALIDACAO_DADO",
-                    app_origem=app_name_log,
                     usuario_operador=operator_id_log,
                     detalhes_evento_json={
                         "validation_type": request.validation_type,
-                        "dado_normalizado": updated_persisted_record.dado_normalizado,
-                        "is_valid": updated_persisted_record.is_valido,
-                        "record_id": str(updated_persisted_record.id) if updated_persisted_record.id else None,
+                        "dado_normalizado": persisted_record.dado_normalizado,
+                        "is_valid": persisted_record.is_valido,
+                        "record_id": str(persisted_record.id) if persisted_record.id else None,
                         "actions_summary": actions_summary,
-                        "final_status_qualificacao": updated_persisted_record.status_qualificacao # Novo: Logar o status final de qualificação
+                        "final_status_qualificacao": persisted_record.status_qualificacao # Novo: Logar o status final de qualificação
                     },
                     status_operacao="SUCESSO",
-                    mensagem_log=f"Validação do tipo '{request.validation_type}' para '{updated_persisted_record.dado_normalizado}' concluída. Válido: {updated_persisted_record.is_valido}. Status Qualificação: {updated_persisted_record.status_qualificacao}. Record ID: {updated_persisted_record.id}",
-                    client_entity_id_afetado=updated_persisted_record.client_entity_id 
+                    mensagem_log=f"Validação do tipo '{request.validation_type}' para '{persisted_record.dado_normalizado}' concluída. Válido: {persisted_record.is_valido}. Status Qualificação: {persisted_record.status_qualificacao}. Record ID: {persisted_record.id}",
+                    client_entity_id_afetado=persisted_record.client_entity_id 
                 )
             )
 
             return response_data
 
         except Exception as e:
-            logger.error(f"Erro no ValidationService.validate_data para tipo '{request.validation_type}': {e}", exc_info=True)
-            # Tenta converter request.data para JSON para o log de erro, se possível
-            error_data_for_log = request.data
-            if hasattr(request.data, 'model_dump'):
-                try:
-                    error_data_for_log = request.data.model_dump()
-                except Exception:
-                    pass # Se falhar, mantém o objeto original
-            elif isinstance(request.data, dict):
-                pass
+            # Sob uma rajada de falhas (ex.: banco indisponível), traceback e payload completos
+            # são registrados só para as primeiras ocorrências de cada tipo de erro na janela.
+            error_details = {"validation_type": request.validation_type, "error": str(e)}
+            if self._should_log_error_details((request.validation_type, type(e).__name__)):
+                logger.error("Erro no ValidationService.validate_data para tipo '%s': %s", request.validation_type, e, exc_info=True)
+                error_details["data"] = request_data_dump
             else:
-                error_data_for_log = str(request.data)
-
-
-            await self.log_repo.add_log_entry(
-                LogEntry(
+                logger.error("Erro no ValidationService.validate_data para tipo '%s' (detalhes suprimidos por amostragem): %s", request.validation_type, e)
+            self.enqueue_log(
+                make_log(
                     tipo_evento="ERRO_VALIDACAO",
-                    app_origem=app_name_log,
                     usuario_operador=operator_id_log,
-                    detalhes_evento_json={"validation_type": request.validation_type, "data": error_data_for_log, "error": str(e)},
+                    detalhes_evento_json=error_details,
                     status_operacao="FALHA",
                     mensagem_log=f"Erro durante a validação do tipo '{request.validation_type}': {e}",
                     client_entity_id_afetado=request.client_identifier 
@@ -257,37 +488,26 @@ class ValidationService:
             )
             return {"status": "error", "message": INTERNAL_SERVER_ERROR_MESSAGE, "status_code": 500}
 
-    async def get_validation_history(self, api_key_str: str, limit: int, include_deleted: bool) -> Dict[str, Any]:
+    async def get_validation_history(self, app_info: Dict[str, Any], limit: int, include_deleted: bool) -> Dict[str, Any]:
         """
         Recupera o histórico de validações para uma determinada aplicação.
+        'app_info' já chega autenticado e ativo (dependência require_active_app).
         """
-        app_info = self.api_key_manager.get_app_info(api_key_str)
         app_name_log = app_info.get("app_name", "Desconhecido")
         operator_id_log = "N/A" # Para histórico, operador pode não ser conhecido
 
-        if not app_info or not app_info.get("is_active"):
-            logger.warning(f"Tentativa de acesso ao histórico com API Key inválida ou inativa: {api_key_str[:8]}...")
-            await self.log_repo.add_log_entry(
-                LogEntry(
-                    tipo_evento="ACESSO_HISTORICO",
-                    app_origem=app_name_log,
-                    usuario_operador=operator_id_log,
-                    detalhes_evento_json={"api_key_prefix": api_key_str[:8], "status": "failed"},
-                    status_operacao="FALHA",
-                    mensagem_log="Tentativa de acesso ao histórico com API Key inválida ou inativa.",
-                    client_entity_id_afetado=None 
-                )
-            )
-            return {"status": "error", "message": API_KEY_INVALID_MESSAGE, "status_code": 401}
+        # Um único timestamp por requisição, compartilhado por todas as entradas de log dela
+        request_ts = datetime.now(timezone.utc)
+        make_log = partial(self._get_log_entry_factory(app_info), timestamp_evento=request_ts, created_at=request_ts)
 
         try:
-            records = await self.repo.get_records_by_app_name(app_name_log, limit, include_deleted)
-            history_list = [HistoryRecordResponse.model_validate(record).model_dump(mode='json') for record in records]
+            # Linhas já restritas às colunas do histórico, tipadas pelo asyncpg: model_construct apenas copia os campos
+            rows = await self.repo.get_history_rows_by_app_name(app_name_log, limit, include_deleted)
+            history_list = [HistoryRecordResponse.model_construct(**row) for row in rows]
             
-            await self.log_repo.add_log_entry(
-                LogEntry(
+            self.enqueue_log(
+                make_log(
                     tipo_evento="ACESSO_HISTORICO",
-                    app_origem=app_name_log,
                     usuario_operador=operator_id_log,
                     detalhes_evento_json={"limit": limit, "include_deleted": include_deleted, "record_count": len(history_list)},
                     status_operacao="SUCESSO",
@@ -302,11 +522,10 @@ class ValidationService:
                 "status_code": 200
             }
         except Exception as e:
-            logger.error(f"Erro ao recuperar histórico para app '{app_name_log}': {e}", exc_info=True)
-            await self.log_repo.add_log_entry(
-                LogEntry(
+            logger.error("Erro ao recuperar histórico para app '%s': %s", app_name_log, e, exc_info=True)
+            self.enqueue_log(
+                make_log(
                     tipo_evento="ERRO_HISTORICO",
-                    app_origem=app_name_log,
                     usuario_operador=operator_id_log,
                     detalhes_evento_json={"limit": limit, "include_deleted": include_deleted, "error": str(e)},
                     status_operacao="FALHA",
@@ -316,186 +535,187 @@ class ValidationService:
             )
             return {"status": "error", "message": INTERNAL_SERVER_ERROR_MESSAGE, "status_code": 500}
 
-    async def soft_delete_record(self, api_key_str: str, record_id: uuid.UUID) -> Dict[str, Any]:
+    async def stream_validation_history(self, app_info: Dict[str, Any], limit: int, include_deleted: bool) -> AsyncIterator[str]:
         """
-        Executa o soft delete de um registro de validação.
-        Requer permissão 'can_delete_records'.
+        Gera o histórico de validações como um array JSON em partes, registro a registro,
+        para ser enviado via StreamingResponse sem montar a lista completa em memória.
+        'app_info' já chega autenticado e ativo (dependência require_active_app).
+        Uma falha depois do primeiro bloco é relançada (não fecha o array): o servidor interrompe a resposta
+        e o cliente recebe um corpo incompleto em vez de um JSON aparentemente válido.
         """
-        app_info = self.api_key_manager.get_app_info(api_key_str)
-        app_name_log = app_info.get('app_name', 'Desconhecido')
-        operator_id_log = "N/A" # Pode ser um usuário autenticado em um cenário real
-
-        record_to_delete = await self.repo.get_record_by_id(record_id)
-        client_entity_id_affected = record_to_delete.client_entity_id if record_to_delete else None
+        app_name_log = app_info.get("app_name", "Desconhecido")
+        operator_id_log = "N/A" # Para histórico, operador pode não ser conhecido
+        # Um único timestamp por requisição, compartilhado por todas as entradas de log dela
+        request_ts = datetime.now(timezone.utc)
+        make_log = partial(self._get_log_entry_factory(app_info), timestamp_evento=request_ts, created_at=request_ts)
+        record_count = 0
 
-        if not app_info or not app_info.get("is_active"):
-            logger.warning(f"Tentativa de soft delete com API Key inválida ou inativa: {api_key_str[:8]}...")
-            await self.log_repo.add_log_entry(
-                LogEntry(
-                    tipo_evento="SOFT_DELETE",
-                    app_origem=app_name_log,
+        try:
+            yield "["
+            async for row in self.repo.stream_history_rows_by_app_name(app_name_log, limit, include_deleted):
+                if record_count:
+                    yield ","
+                # A linha já traz exatamente os campos do HistoryRecordResponse: serializada direto com orjson
+                # (UUID e datetime nativos; OPT_UTC_Z mantém o sufixo 'Z' da serialização do Pydantic)
+                yield orjson.dumps(row, option=orjson.OPT_UTC_Z).decode()
+                record_count += 1
+            yield "]"
+        except Exception as e:
+            # A resposta já começou a ser enviada: registra o erro e interrompe o stream
+            logger.error("Erro ao transmitir histórico para app '%s': %s", app_name_log, e, exc_info=True)
+            self.enqueue_log(
+                make_log(
+                    tipo_evento="ERRO_HISTORICO",
                     usuario_operador=operator_id_log,
-                    detalhes_evento_json={"record_id": str(record_id), "status": "failed", "reason": "API Key inválida"},
+                    detalhes_evento_json={"limit": limit, "include_deleted": include_deleted, "records_sent": record_count, "error": str(e)},
                     status_operacao="FALHA",
-                    mensagem_log="Tentativa de soft delete com API Key inválida ou inativa.",
-                    related_record_id=record_id,
-                    client_entity_id_afetado=client_entity_id_affected 
+                    mensagem_log=f"Erro ao transmitir histórico para o app '{app_name_log}': {e}",
+                    client_entity_id_afetado=None
                 )
             )
-            return {"status": "error", "message": API_KEY_INVALID_MESSAGE, "status_code": 401}
-        
+            raise
+
+        self.enqueue_log(
+            make_log(
+                tipo_evento="ACESSO_HISTORICO",
+                usuario_operador=operator_id_log,
+                detalhes_evento_json={"limit": limit, "include_deleted": include_deleted, "record_count": record_count},
+                status_operacao="SUCESSO",
+                mensagem_log=f"Histórico de validações transmitido para o app '{app_name_log}'. {record_count} registros.",
+                client_entity_id_afetado=None
+            )
+        )
+
+    async def soft_delete_record(self, app_info: Dict[str, Any], record_id: uuid.UUID) -> Dict[str, Any]:
+        """
+        Executa o soft delete de um registro de validação.
+        Requer permissão 'can_delete_records'; 'app_info' já chega autenticado e ativo.
+        """
+        app_name_log = app_info.get('app_name', 'Desconhecido')
+        operator_id_log = "N/A" # Pode ser um usuário autenticado em um cenário real
+        record_id_str = str(record_id) # Convertido uma única vez e reutilizado nos logs e mensagens
+
+        # Campos comuns a todas as entradas de log desta operação (um único timestamp por requisição);
+        # cada ponto de log informa apenas o que muda. O client_entity_id só é conhecido após o
+        # UPDATE ... RETURNING, por isso só é preenchido no caminho de sucesso.
+        request_ts = datetime.now(timezone.utc)
+        make_log = partial(
+            self._get_log_entry_factory(app_info),
+            timestamp_evento=request_ts,
+            created_at=request_ts,
+            tipo_evento="SOFT_DELETE",
+            usuario_operador=operator_id_log,
+            related_record_id=record_id
+        )
+
         if not app_info.get("can_delete_records"):
-            logger.warning(f"Aplicação '{app_name_log}' sem permissão para soft delete de registro {record_id}.")
-            await self.log_repo.add_log_entry(
-                LogEntry(
-                    tipo_evento="SOFT_DELETE",
-                    app_origem=app_name_log,
-                    usuario_operador=operator_id_log,
-                    detalhes_evento_json={"record_id": str(record_id), "status": "failed", "reason": "Sem permissão"},
+            logger.warning("Aplicação '%s' sem permissão para soft delete de registro %s.", app_name_log, record_id_str)
+            self.enqueue_log(
+                make_log(
+                    detalhes_evento_json={"record_id": record_id_str, "status": "failed", "reason": "Sem permissão"},
                     status_operacao="FALHA",
-                    mensagem_log=f"Aplicação '{app_name_log}' sem permissão para soft delete de registro {record_id}.",
-                    related_record_id=record_id,
-                    client_entity_id_afetado=client_entity_id_affected 
+                    mensagem_log=f"Aplicação '{app_name_log}' sem permissão para soft delete de registro {record_id_str}."
                 )
             )
             return {"status": "error", "message": "Permissão negada: Sua API Key não tem privilégios para deletar registros.", "status_code": 403}
 
         try:
-            success = await self.repo.soft_delete_record(record_id)
-            if success:
-                record = await self.repo.get_record_by_id(record_id)
-                await self.log_repo.add_log_entry(
-                    LogEntry(
-                        tipo_evento="SOFT_DELETE",
-                        app_origem=app_name_log,
-                        usuario_operador=record.usuario_atualizacao if record else operator_id_log,
-                        detalhes_evento_json={"record_id": str(record_id), "status": "success"},
+            updated_record = await self.repo.soft_delete_record(record_id)
+            if updated_record:
+                self.enqueue_log(
+                    make_log(
+                        usuario_operador=updated_record.usuario_atualizacao or operator_id_log,
+                        detalhes_evento_json={"record_id": record_id_str, "status": "success"},
                         status_operacao="SUCESSO",
-                        mensagem_log=f"Registro {record_id} soft-deletado com sucesso.",
-                        related_record_id=record_id,
-                        client_entity_id_afetado=client_entity_id_affected 
+                        mensagem_log=f"Registro {record_id_str} soft-deletado com sucesso.",
+                        client_entity_id_afetado=updated_record.client_entity_id
                     )
                 )
-                return {"status": "success", "message": f"Registro {record_id} soft-deletado com sucesso.", "status_code": 200}
+                return {"status": "success", "message": f"Registro {record_id_str} soft-deletado com sucesso.", "status_code": 200}
             else:
-                await self.log_repo.add_log_entry(
-                    LogEntry(
-                        tipo_evento="SOFT_DELETE",
-                        app_origem=app_name_log,
-                        usuario_operador=operator_id_log,
-                        detalhes_evento_json={"record_id": str(record_id), "status": "failed", "reason": "Não encontrado ou já deletado"},
+                self.enqueue_log(
+                    make_log(
+                        detalhes_evento_json={"record_id": record_id_str, "status": "failed", "reason": "Não encontrado ou já deletado"},
                         status_operacao="FALHA",
-                        mensagem_log=f"Falha ao soft-deletar registro {record_id}: Não encontrado ou já deletado.",
-                        related_record_id=record_id,
-                        client_entity_id_afetado=client_entity_id_affected 
+                        mensagem_log=f"Falha ao soft-deletar registro {record_id_str}: Não encontrado ou já deletado."
                     )
                 )
-                return {"status": "error", "message": f"Registro {record_id} não encontrado ou já foi soft-deletado.", "status_code": 404}
+                return {"status": "error", "message": f"Registro {record_id_str} não encontrado ou já foi soft-deletado.", "status_code": 404}
 
         except Exception as e:
-            logger.error(f"Erro ao soft-deletar registro {record_id} para app '{app_name_log}': {e}", exc_info=True)
-            await self.log_repo.add_log_entry(
-                LogEntry(
+            logger.error("Erro ao soft-deletar registro %s para app '%s': %s", record_id_str, app_name_log, e, exc_info=True)
+            self.enqueue_log(
+                make_log(
                     tipo_evento="ERRO_SOFT_DELETE",
-                    app_origem=app_name_log,
-                    usuario_operador=operator_id_log,
-                    detalhes_evento_json={"record_id": str(record_id), "error": str(e)},
+                    detalhes_evento_json={"record_id": record_id_str, "error": str(e)},
                     status_operacao="FALHA",
-                    mensagem_log=f"Erro ao soft-deletar registro {record_id}: {e}",
-                    related_record_id=record_id,
-                    client_entity_id_afetado=client_entity_id_affected 
+                    mensagem_log=f"Erro ao soft-deletar registro {record_id_str}: {e}"
                 )
             )
             return {"status": "error", "message": INTERNAL_SERVER_ERROR_MESSAGE, "status_code": 500}
 
-    async def restore_record(self, api_key_str: str, record_id: uuid.UUID) -> Dict[str, Any]:
+    async def restore_record(self, app_info: Dict[str, Any], record_id: uuid.UUID) -> Dict[str, Any]:
         """
         Restaura um registro de validação que foi soft-deletado.
-        Requer permissão 'can_delete_records'.
+        Requer permissão 'can_delete_records'; 'app_info' já chega autenticado e ativo.
         """
-        app_info = self.api_key_manager.get_app_info(api_key_str)
         app_name_log = app_info.get('app_name', 'Desconhecido')
         operator_id_log = "N/A" # Pode ser um usuário autenticado
-
-        record_to_restore = await self.repo.get_record_by_id(record_id)
-        client_entity_id_affected = record_to_restore.client_entity_id if record_to_restore else None
-
-        if not app_info or not app_info.get("is_active"):
-            logger.warning(f"Tentativa de restauração com API Key inválida ou inativa: {api_key_str[:8]}...")
-            await self.log_repo.add_log_entry(
-                LogEntry(
-                    tipo_evento="RESTAURACAO",
-                    app_origem=app_name_log,
-                    usuario_operador=operator_id_log,
-                    detalhes_evento_json={"record_id": str(record_id), "status": "failed", "reason": "API Key inválida"},
-                    status_operacao="FALHA",
-                    mensagem_log="Tentativa de restauração com API Key inválida ou inativa.",
-                    related_record_id=record_id,
-                    client_entity_id_afetado=client_entity_id_affected 
-                )
-            )
-            return {"status": "error", "message": API_KEY_INVALID_MESSAGE, "status_code": 401}
+        record_id_str = str(record_id) # Convertido uma única vez e reutilizado nos logs e mensagens
+
+        # Mesmos campos comuns de log do soft_delete_record
+        request_ts = datetime.now(timezone.utc)
+        make_log = partial(
+            self._get_log_entry_factory(app_info),
+            timestamp_evento=request_ts,
+            created_at=request_ts,
+            tipo_evento="RESTAURACAO",
+            usuario_operador=operator_id_log,
+            related_record_id=record_id
+        )
 
         if not app_info.get("can_delete_records"):
-            logger.warning(f"Aplicação '{app_name_log}' sem permissão para restaurar registro {record_id}.")
-            await self.log_repo.add_log_entry(
-                LogEntry(
-                    tipo_evento="RESTAURACAO",
-                    app_origem=app_name_log,
-                    usuario_operador=operator_id_log,
-                    detalhes_evento_json={"record_id": str(record_id), "status": "failed", "reason": "Sem permissão"},
+            logger.warning("Aplicação '%s' sem permissão para restaurar registro %s.", app_name_log, record_id_str)
+            self.enqueue_log(
+                make_log(
+                    detalhes_evento_json={"record_id": record_id_str, "status": "failed", "reason": "Sem permissão"},
                     status_operacao="FALHA",
-                    mensagem_log=f"Aplicação '{app_name_log}' sem permissão para restaurar registro {record_id}.",
-                    related_record_id=record_id,
-                    client_entity_id_afetado=client_entity_id_affected 
+                    mensagem_log=f"Aplicação '{app_name_log}' sem permissão para restaurar registro {record_id_str}."
                 )
             )
             return {"status": "error", "message": "Permissão negada: Sua API Key não tem privilégios para restaurar registros.", "status_code": 403}
 
         try:
-            success = await self.repo.restore_record(record_id)
-            if success:
-                record = await self.repo.get_record_by_id(record_id)
-                await self.log_repo.add_log_entry(
-                    LogEntry(
-                        tipo_evento="RESTAURACAO",
-                        app_origem=app_name_log,
-                        usuario_operador=record.usuario_atualizacao if record else operator_id_log,
-                        detalhes_evento_json={"record_id": str(record_id), "status": "success"},
+            updated_record = await self.repo.restore_record(record_id)
+            if updated_record:
+                self.enqueue_log(
+                    make_log(
+                        usuario_operador=updated_record.usuario_atualizacao or operator_id_log,
+                        detalhes_evento_json={"record_id": record_id_str, "status": "success"},
                         status_operacao="SUCESSO",
-                        mensagem_log=f"Registro {record_id} restaurado com sucesso.",
-                        related_record_id=record_id,
-                        client_entity_id_afetado=client_entity_id_affected 
+                        mensagem_log=f"Registro {record_id_str} restaurado com sucesso.",
+                        client_entity_id_afetado=updated_record.client_entity_id
                     )
                 )
-                return {"status": "success", "message": f"Registro {record_id} restaurado com sucesso.", "status_code": 200}
+                return {"status": "success", "message": f"Registro {record_id_str} restaurado com sucesso.", "status_code": 200}
             else:
-                await self.log_repo.add_log_entry(
-                    LogEntry(
-                        tipo_evento="RESTAURACAO",
-                        app_origem=app_name_log,
-                        usuario_operador=operator_id_log,
-                        detalhes_evento_json={"record_id": str(record_id), "status": "failed", "reason": "Não encontrado ou não estava deletado"},
+                self.enqueue_log(
+                    make_log(
+                        detalhes_evento_json={"record_id": record_id_str, "status": "failed", "reason": "Não encontrado ou não estava deletado"},
                         status_operacao="FALHA",
-                        mensagem_log=f"Falha ao restaurar registro {record_id}: Não encontrado ou não estava soft-deletado.",
-                        related_record_id=record_id,
-                        client_entity_id_afetado=client_entity_id_affected 
+                        mensagem_log=f"Falha ao restaurar registro {record_id_str}: Não encontrado ou não estava soft-deletado."
                     )
                 )
-                return {"status": "error", "message": f"Registro {record_id} não encontrado ou não estava soft-deletado.", "status_code": 404}
+                return {"status": "error", "message": f"Registro {record_id_str} não encontrado ou não estava soft-deletado.", "status_code": 404}
 
         except Exception as e:
-            logger.error(f"Erro ao restaurar registro {record_id} para app '{app_name_log}': {e}", exc_info=True)
-            await self.log_repo.add_log_entry(
-                LogEntry(
+            logger.error("Erro ao restaurar registro %s para app '%s': %s", record_id_str, app_name_log, e, exc_info=True)
+            self.enqueue_log(
+                make_log(
                     tipo_evento="ERRO_RESTAURACAO",
-                    app_origem=app_name_log,
-                    usuario_operador=operator_id_log,
-                    detalhes_evento_json={"record_id": str(record_id), "error": str(e)},
+                    detalhes_evento_json={"record_id": record_id_str, "error": str(e)},
                     status_operacao="FALHA",
-                    mensagem_log=f"Erro ao restaurar registro {record_id}: {e}",
-                    related_record_id=record_id,
-                    client_entity_id_afetado=client_entity_id_affected 
+                    mensagem_log=f"Erro ao restaurar registro {record_id_str}: {e}"
                 )
             )
             return {"status": "error", "message": INTERNAL_SERVER_ERROR_MESSAGE, "status_code": 500}
@@ -0,0 +1,34 @@
+# conftest.py
+
+import pytest
+from unittest.mock import MagicMock
+
+@pytest.fixture
+def make_validation_service():
+    """
+    Fábrica de ValidationService com todas as dependências simuladas (MagicMock).
+    Os testes passam apenas as dependências que exercitam (ex.: log_repo, repo, validadores).
+    """
+    # Import local: testes que não usam o serviço (ex.: test_ttl_cache.py) não dependem de asyncpg/pydantic
+    from app.services.validation_service import ValidationService
+
+    def _make(log_repo=None, **overrides):
+        dependencies = {
+            "api_key_manager": MagicMock(),
+            "repo": MagicMock(),
+            "qualification_repo": MagicMock(),
+            "decision_rules": MagicMock(),
+            "phone_validator": MagicMock(),
+            "cep_validator": MagicMock(),
+            "email_validator": MagicMock(),
+            "cpf_cnpj_validator": MagicMock(),
+            "address_validator": MagicMock(),
+            "nome_validator": MagicMock(),
+            "sexo_validator": MagicMock(),
+            "rg_validator": MagicMock(),
+            "data_nascimento_validator": MagicMock(),
+            "log_repo": log_repo if log_repo is not None else MagicMock(),
+        }
+        dependencies.update(overrides)
+        return ValidationService(**dependencies)
+    return _make
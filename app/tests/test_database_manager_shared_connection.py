@@ -0,0 +1,91 @@
+# test_database_manager_shared_connection.py
+
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from app.database.manager import DatabaseManager
+
+class _FakePool:
+    """Pool simulado: entrega conexões distintas e registra cada acquire/release."""
+    def __init__(self):
+        self._closed = False
+        self.acquired = []
+        self.released = []
+
+    @asynccontextmanager
+    async def acquire(self):
+        conn = object()
+        self.acquired.append(conn)
+        try:
+            yield conn
+        finally:
+            self.released.append(conn)
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    pool = _FakePool()
+    monkeypatch.setattr(DatabaseManager, "_pool", pool)
+    return pool
+
+@pytest.fixture
+def db_manager(fake_pool):
+    return DatabaseManager.get_instance()
+
+@pytest.mark.asyncio
+async def test_get_connection_reutiliza_conexao_compartilhada(db_manager, fake_pool):
+    """Testa que get_connection() dentro do bloco reutiliza a conexão compartilhada sem liberá-la."""
+    async with db_manager.shared_connection() as shared_conn:
+        async with db_manager.get_connection() as conn_1:
+            pass
+        async with db_manager.get_connection() as conn_2:
+            pass
+        assert conn_1 is shared_conn
+        assert conn_2 is shared_conn
+        assert fake_pool.released == []
+
+    assert fake_pool.acquired == [shared_conn]
+    assert fake_pool.released == [shared_conn]
+
+@pytest.mark.asyncio
+async def test_blocos_aninhados_reutilizam_conexao_externa(db_manager, fake_pool):
+    """Testa que um shared_connection() aninhado reutiliza a conexão externa e não a libera ao sair."""
+    async with db_manager.shared_connection() as outer_conn:
+        async with db_manager.shared_connection() as inner_conn:
+            assert inner_conn is outer_conn
+        assert fake_pool.released == []
+        async with db_manager.get_connection() as conn:
+            assert conn is outer_conn
+
+    assert len(fake_pool.acquired) == 1
+    assert fake_pool.released == [outer_conn]
+
+@pytest.mark.asyncio
+async def test_conexao_liberada_e_desvinculada_apos_erro(db_manager, fake_pool):
+    """Testa que uma exceção no bloco libera a conexão e desfaz o vínculo com o contexto."""
+    with pytest.raises(RuntimeError):
+        async with db_manager.shared_connection() as shared_conn:
+            raise RuntimeError("falha na consulta")
+
+    assert fake_pool.released == [shared_conn]
+    # Fora do bloco, get_connection() volta a adquirir uma conexão nova do pool
+    async with db_manager.get_connection() as conn:
+        assert conn is not shared_conn
+    assert len(fake_pool.acquired) == 2
+
+@pytest.mark.asyncio
+async def test_tarefas_concorrentes_nao_compartilham_conexao(db_manager, fake_pool):
+    """Testa que cada tarefa assíncrona tem sua própria conexão compartilhada (vínculo por contexto)."""
+    ready = asyncio.Event()
+
+    async def use_shared_connection():
+        async with db_manager.shared_connection() as conn:
+            await ready.wait()
+            return conn
+
+    tasks = [asyncio.create_task(use_shared_connection()) for _ in range(2)]
+    await asyncio.sleep(0)
+    ready.set()
+    conn_1, conn_2 = await asyncio.gather(*tasks)
+
+    assert conn_1 is not conn_2
+    assert sorted(map(id, fake_pool.released)) == sorted(map(id, fake_pool.acquired))
@@ -0,0 +1,51 @@
+# test_decision_rules_trivial.py
+
+import pytest
+from unittest.mock import MagicMock
+from app.models.validation_record import ValidationRecord
+from app.rules.decision_rules import DecisionRules
+
+@pytest.fixture
+def decision_rules():
+    return DecisionRules(validation_repo=MagicMock(), qualification_repo=MagicMock())
+
+def _make_record(tipo_validacao: str, validation_details: dict = None) -> ValidationRecord:
+    return ValidationRecord(
+        dado_original="teste@exemplo.com",
+        dado_normalizado="teste@exemplo.com",
+        is_valido=True,
+        mensagem="Dado válido.",
+        origem_validacao="teste",
+        tipo_validacao=tipo_validacao,
+        app_name="app_teste",
+        validation_details=validation_details or {}
+    )
+
+def test_tipo_simples_resolvido_como_unqualified(decision_rules):
+    """Testa que um tipo sem validações de telefone é resolvido antes do INSERT como UNQUALIFIED."""
+    record = _make_record("email")
+
+    summary = decision_rules.resolve_trivial_decision(record)
+
+    assert summary is not None
+    assert summary["status_qualificacao_set"] == "UNQUALIFIED"
+    assert summary["is_golden_record_candidate"] is False
+    assert summary["moved_to_qualificacoes_pendentes_queue"] is False
+    assert summary["client_entity_created_or_updated"] is False
+    assert record.status_qualificacao == "UNQUALIFIED"
+    assert record.is_golden_record is False
+
+def test_pessoa_completa_nao_e_trivial(decision_rules):
+    """Testa que 'pessoa_completa' sempre segue para apply_rules."""
+    record = _make_record("pessoa_completa")
+
+    assert decision_rules.resolve_trivial_decision(record) is None
+    assert record.status_qualificacao is None
+
+@pytest.mark.parametrize("phone_field", ["celular", "telefone_fixo"])
+def test_validacao_de_telefone_nao_e_trivial(decision_rules, phone_field):
+    """Testa que registros com validação individual de telefone seguem para apply_rules."""
+    record = _make_record("telefone", {"individual_validations": {phone_field: {"is_valid": True}}})
+
+    assert decision_rules.resolve_trivial_decision(record) is None
+    assert record.status_qualificacao is None
@@ -0,0 +1,67 @@
+# test_qualification_repository_upsert.py
+
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+from app.database.repositories.qualification_repository import QualificationRepository
+
+@pytest.fixture
+def conn():
+    return AsyncMock()
+
+@pytest.fixture
+def repository(conn):
+    db_manager = MagicMock()
+
+    @asynccontextmanager
+    async def get_connection():
+        yield conn
+
+    db_manager.get_connection = get_connection
+    return QualificationRepository(db_manager)
+
+@pytest.fixture
+def client_entity_data():
+    return {
+        "main_document_normalized": "12345678909",
+        "golden_record_cpf_cnpj_id": "id-cpf",
+        "golden_record_email_id": "id-email",
+        "consolidated_data": {"nome": "Maria"},
+        "relationship_type": "cliente",
+        "cclub": "C1"
+    }
+
+@pytest.mark.asyncio
+async def test_upsert_executa_uma_unica_consulta(repository, conn, client_entity_data):
+    """Testa que o upsert usa um único INSERT ... ON CONFLICT e retorna a linha com a chave 'inserted'."""
+    conn.fetchrow.return_value = {"main_document_normalized": "12345678909", "inserted": True}
+
+    result = await repository.upsert_client_entity(client_entity_data)
+
+    assert result == {"main_document_normalized": "12345678909", "inserted": True}
+    conn.fetchrow.assert_awaited_once()
+    sql, *params = conn.fetchrow.await_args.args
+    assert "ON CONFLICT (main_document_normalized) DO UPDATE" in sql
+    assert "RETURNING" in sql
+    assert params[0] == "12345678909"
+    assert params[6] == {"nome": "Maria"}
+    assert params[8] == "C1"
+    conn.fetch.assert_not_awaited()
+    conn.execute.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_upsert_sem_consolidated_data_envia_dict_vazio(repository, conn, client_entity_data):
+    """Testa que consolidated_data ausente é enviado como dict vazio para a coluna JSONB."""
+    del client_entity_data["consolidated_data"]
+    conn.fetchrow.return_value = {"main_document_normalized": "12345678909", "inserted": False}
+
+    await repository.upsert_client_entity(client_entity_data)
+
+    assert conn.fetchrow.await_args.args[7] == {}
+
+@pytest.mark.asyncio
+async def test_upsert_com_erro_retorna_none(repository, conn, client_entity_data):
+    """Testa que um erro no banco é registrado e o upsert retorna None."""
+    conn.fetchrow.side_effect = RuntimeError("falha no banco")
+
+    assert await repository.upsert_client_entity(client_entity_data) is None
@@ -0,0 +1,67 @@
+# test_records_endpoint.py
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.api.dependencies import require_active_app
+from app.api.routers import validation as validation_router
+from app.api.routers.validation import RECORDS_MAX_LIMIT, RECORDS_STREAM_THRESHOLD
+
+@pytest.fixture
+def validation_service():
+    service = MagicMock()
+    service.get_validation_history = AsyncMock(return_value={"status": "success", "history": []})
+    return service
+
+@pytest.fixture
+def client(validation_service):
+    """Aplicação mínima com o router de validação e as dependências de autenticação/serviço substituídas."""
+    app = FastAPI()
+    app.include_router(validation_router.router, prefix="/api/v1")
+    app.dependency_overrides[require_active_app] = lambda: {"app_name": "app_teste"}
+    app.dependency_overrides[validation_router.get_validation_service] = lambda: validation_service
+    return TestClient(app)
+
+def test_limite_pequeno_monta_lista_em_memoria(client, validation_service):
+    """Testa que limites até RECORDS_STREAM_THRESHOLD usam a leitura completa, sem streaming."""
+    response = client.get("/api/v1/records", params={"limit": RECORDS_STREAM_THRESHOLD})
+
+    assert response.status_code == 200
+    assert response.json() == []
+    validation_service.get_validation_history.assert_awaited_once()
+    validation_service.stream_validation_history.assert_not_called()
+
+def test_erro_no_limite_pequeno_retorna_erro_http(client, validation_service):
+    """Testa que uma falha na leitura completa vira erro HTTP, e não um 200 com corpo incompleto."""
+    validation_service.get_validation_history.return_value = {
+        "status": "error", "message": "Erro interno ao obter histórico.", "status_code": 500
+    }
+
+    response = client.get("/api/v1/records")
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Erro interno ao obter histórico."
+
+def test_limite_grande_transmite_por_streaming(client, validation_service):
+    """Testa que limites acima de RECORDS_STREAM_THRESHOLD transmitem o array JSON gerado pelo serviço."""
+    async def history_stream():
+        yield b"["
+        yield b"]"
+
+    validation_service.stream_validation_history = MagicMock(return_value=history_stream())
+
+    response = client.get("/api/v1/records", params={"limit": RECORDS_STREAM_THRESHOLD + 1})
+
+    assert response.status_code == 200
+    assert response.json() == []
+    validation_service.stream_validation_history.assert_called_once()
+    validation_service.get_validation_history.assert_not_awaited()
+
+@pytest.mark.parametrize("limit", [0, RECORDS_MAX_LIMIT + 1])
+def test_limite_fora_do_intervalo_rejeitado(client, validation_service, limit):
+    """Testa que limites fora de 1..RECORDS_MAX_LIMIT são rejeitados antes de consultar o banco."""
+    response = client.get("/api/v1/records", params={"limit": limit})
+
+    assert response.status_code == 422
+    validation_service.get_validation_history.assert_not_awaited()
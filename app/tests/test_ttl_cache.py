@@ -0,0 +1,65 @@
+# test_ttl_cache.py
+
+import pytest
+from app.utils import ttl_cache as ttl_cache_module
+from app.utils.ttl_cache import TTLCache
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Relógio controlado manualmente, no lugar de time.monotonic."""
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+def test_get_retorna_valor_gravado(clock):
+    """Testa que um valor gravado é retornado enquanto não expira."""
+    cache = TTLCache(maxsize=10, ttl_seconds=60)
+    cache.set(("email", b"a@b.com"), {"is_valid": True})
+
+    assert cache.get(("email", b"a@b.com")) == {"is_valid": True}
+    assert cache.get(("email", b"outro@b.com")) is None
+
+def test_entrada_expira_apos_ttl(clock):
+    """Testa que a entrada expira 'ttl_seconds' após ser gravada e é removida do cache."""
+    cache = TTLCache(maxsize=10, ttl_seconds=60)
+    cache.set("chave", "valor")
+
+    clock[0] += 59
+    assert cache.get("chave") == "valor"
+    clock[0] += 1
+    assert cache.get("chave") is None
+    assert len(cache) == 0
+
+def test_set_renova_expiracao(clock):
+    """Testa que regravar uma chave reinicia o tempo de expiração."""
+    cache = TTLCache(maxsize=10, ttl_seconds=60)
+    cache.set("chave", "v1")
+    clock[0] += 50
+    cache.set("chave", "v2")
+    clock[0] += 50
+
+    assert cache.get("chave") == "v2"
+
+def test_descarta_entrada_menos_usada_recentemente(clock):
+    """Testa que, ao atingir maxsize, a entrada usada há mais tempo (LRU) é descartada."""
+    cache = TTLCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Leitura de 'a' a torna a mais recente; 'b' passa a ser a LRU
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+def test_clear_remove_todas_as_entradas(clock):
+    """Testa que clear esvazia o cache."""
+    cache = TTLCache(maxsize=10, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.get("a") is None
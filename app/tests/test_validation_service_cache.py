@@ -0,0 +1,87 @@
+# test_validation_service_cache.py
+
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, MagicMock
+from app.api.schemas.common import UniversalValidationRequest
+
+APP_INFO = {"app_name": "app_teste"}
+
+def _validator_result(normalized: str) -> dict:
+    return {
+        "is_valid": True,
+        "dado_normalizado": normalized,
+        "mensagem": "E-mail válido.",
+        "origem_validacao": "teste",
+        "details": {}
+    }
+
+def _make_request(client_identifier: str = "cliente_1", cache_bypass: bool = False) -> UniversalValidationRequest:
+    return UniversalValidationRequest(
+        validation_type="email",
+        data={"email": "teste@exemplo.com"},
+        client_identifier=client_identifier,
+        cache_bypass=cache_bypass
+    )
+
+@pytest.fixture
+def email_validator():
+    validator = MagicMock()
+    validator.validate = AsyncMock(return_value=_validator_result("teste@exemplo.com"))
+    return validator
+
+@pytest.fixture
+def repo():
+    repository = MagicMock()
+    # create_record devolve o próprio registro, como o INSERT ... RETURNING *
+    repository.create_record = AsyncMock(side_effect=lambda record: record)
+    return repository
+
+@pytest.fixture
+def log_repo():
+    repository = MagicMock()
+    repository.add_log_entries_bulk = AsyncMock(side_effect=lambda batch: len(batch))
+    return repository
+
+@pytest_asyncio.fixture
+async def service(make_validation_service, email_validator, repo, log_repo):
+    service = make_validation_service(log_repo=log_repo, repo=repo, email_validator=email_validator)
+    yield service
+    # Encerra a tarefa de escrita dos logs de auditoria enfileirados por validate_data
+    await service.flush_logs()
+
+@pytest.mark.asyncio
+async def test_cache_hit_dispensa_validador_mas_persiste(service, email_validator, repo):
+    """Testa que um acerto no cache não executa o validador, mas cada requisição continua gravando seu registro."""
+    first = await service.validate_data(APP_INFO, _make_request())
+    second = await service.validate_data(APP_INFO, _make_request())
+
+    assert email_validator.validate.await_count == 1
+    assert repo.create_record.await_count == 2
+    assert first.status == "success"
+    assert second.status == "success"
+    assert second.dado_normalizado == first.dado_normalizado
+
+@pytest.mark.asyncio
+async def test_cache_bypass_reexecuta_validador_e_sobrescreve_entrada(service, email_validator, repo):
+    """Testa que cache_bypass=True executa o validador de novo e substitui o resultado em cache."""
+    await service.validate_data(APP_INFO, _make_request())
+    email_validator.validate.return_value = _validator_result("novo@exemplo.com")
+
+    bypassed = await service.validate_data(APP_INFO, _make_request(cache_bypass=True))
+    cached = await service.validate_data(APP_INFO, _make_request())
+
+    assert email_validator.validate.await_count == 2
+    assert repo.create_record.await_count == 3
+    assert bypassed.dado_normalizado == "novo@exemplo.com"
+    # A requisição seguinte, sem bypass, recebe o resultado gravado pelo bypass
+    assert cached.dado_normalizado == "novo@exemplo.com"
+
+@pytest.mark.asyncio
+async def test_cache_nao_e_compartilhado_entre_clientes(service, email_validator):
+    """Testa que o mesmo dado enviado por outro client_identifier executa o validador novamente."""
+    await service.validate_data(APP_INFO, _make_request(client_identifier="cliente_1"))
+    await service.validate_data(APP_INFO, _make_request(client_identifier="cliente_2"))
+
+    assert email_validator.validate.await_count == 2
+    assert [call.kwargs["client_identifier"] for call in email_validator.validate.await_args_list] == ["cliente_1", "cliente_2"]
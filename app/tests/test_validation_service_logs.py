@@ -0,0 +1,82 @@
+# test_validation_service_logs.py
+
+import logging
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from app.services import validation_service as validation_service_module
+from app.database.repositories.log_repository import LogEntry
+
+def _make_log_entry(index: int) -> LogEntry:
+    return LogEntry(
+        tipo_evento="VALIDACAO_DADO",
+        app_origem="app_teste",
+        status_operacao="SUCESSO",
+        mensagem_log=f"log {index}"
+    )
+
+@pytest.fixture
+def log_repo():
+    repo = MagicMock()
+    repo.add_log_entries_bulk = AsyncMock(side_effect=lambda batch: len(batch))
+    repo.add_log_entry = AsyncMock(side_effect=lambda entry: entry)
+    return repo
+
+def _written_entries(bulk_mock: AsyncMock) -> list:
+    return [entry for call in bulk_mock.await_args_list for entry in call.args[0]]
+
+@pytest.mark.asyncio
+async def test_flush_logs_grava_entradas_pendentes(make_validation_service, log_repo):
+    """Testa que flush_logs (shutdown) grava todos os logs enfileirados e encerra a tarefa de escrita."""
+    service = make_validation_service(log_repo=log_repo)
+    entries = [_make_log_entry(i) for i in range(5)]
+    for entry in entries:
+        service.enqueue_log(entry)
+
+    await service.flush_logs()
+
+    assert _written_entries(log_repo.add_log_entries_bulk) == entries
+    log_repo.add_log_entry.assert_not_awaited()
+    assert service._log_writer_task is None
+    assert service._log_queue.empty()
+
+@pytest.mark.asyncio
+async def test_flush_logs_sem_logs_enfileirados(make_validation_service, log_repo):
+    """Testa que flush_logs não faz nada quando nenhum log foi enfileirado."""
+    service = make_validation_service(log_repo=log_repo)
+
+    await service.flush_logs()
+
+    log_repo.add_log_entries_bulk.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_falha_no_lote_grava_entrada_por_entrada(make_validation_service, log_repo, caplog):
+    """Testa que, se o INSERT em lote falhar, cada entrada é gravada individualmente e as perdas são registradas."""
+    entries = [_make_log_entry(i) for i in range(3)]
+    log_repo.add_log_entries_bulk = AsyncMock(return_value=0)
+    # A segunda entrada também falha individualmente
+    log_repo.add_log_entry = AsyncMock(side_effect=lambda entry: None if entry is entries[1] else entry)
+    service = make_validation_service(log_repo=log_repo)
+
+    with caplog.at_level(logging.WARNING, logger=validation_service_module.__name__):
+        for entry in entries:
+            service.enqueue_log(entry)
+        await service.flush_logs()
+
+    assert [call.args[0] for call in log_repo.add_log_entry.await_args_list] == entries
+    assert "gravando individualmente" in caplog.text
+    assert "1 de 3 logs de auditoria" in caplog.text
+
+@pytest.mark.asyncio
+async def test_fila_cheia_descarta_e_contabiliza(make_validation_service, log_repo, monkeypatch):
+    """Testa que, com a fila cheia, novas entradas são descartadas (sem bloquear) e contabilizadas."""
+    monkeypatch.setattr(validation_service_module, "LOG_QUEUE_MAX_SIZE", 2)
+    service = make_validation_service(log_repo=log_repo)
+    entries = [_make_log_entry(i) for i in range(4)]
+
+    # enqueue_log é síncrono: a tarefa de escrita só roda no próximo await, então a fila enche
+    for entry in entries:
+        service.enqueue_log(entry)
+
+    assert service._dropped_log_count == 2
+    await service.flush_logs()
+    assert _written_entries(log_repo.add_log_entries_bulk) == entries[:2]
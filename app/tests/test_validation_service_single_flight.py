@@ -0,0 +1,89 @@
+# test_validation_service_single_flight.py
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+
+@pytest.fixture
+def service(make_validation_service):
+    """ValidationService com dependências simuladas; os testes chamam _validate_single_flight diretamente."""
+    return make_validation_service()
+
+@pytest.fixture
+def request_data():
+    return SimpleNamespace(validation_type="email", data="teste@exemplo.com", client_identifier="cliente_1")
+
+class _BlockingValidator:
+    """Validador que só termina quando 'release' é sinalizado e conta quantas vezes foi executado."""
+    def __init__(self, fail_first: bool = False):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.fail_first = fail_first
+
+    async def validate(self, data, client_identifier=None):
+        self.calls += 1
+        call_number = self.calls
+        await self.release.wait()
+        if self.fail_first and call_number == 1:
+            raise RuntimeError("falha no validador")
+        return {"is_valid": True, "cleaned_data": data, "call": call_number}
+
+@pytest.mark.asyncio
+async def test_requisicoes_simultaneas_executam_validador_uma_vez(service, request_data):
+    """Testa que requisições idênticas simultâneas compartilham uma única execução do validador."""
+    validator = _BlockingValidator()
+    cache_key = service._validation_cache_key(request_data.validation_type, request_data.client_identifier, request_data.data)
+
+    tasks = [
+        asyncio.create_task(service._validate_single_flight(cache_key, validator.validate, request_data))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    validator.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert validator.calls == 1
+    assert all(result is results[0] for result in results)
+    assert service._validation_result_cache.get(cache_key) is results[0]
+    assert service._inflight_validations == {}
+
+@pytest.mark.asyncio
+async def test_falha_do_lider_faz_espera_executar_validador(service, request_data):
+    """Testa que, se a execução original falhar, a requisição em espera executa o validador por conta própria."""
+    validator = _BlockingValidator(fail_first=True)
+    cache_key = service._validation_cache_key(request_data.validation_type, request_data.client_identifier, request_data.data)
+
+    leader = asyncio.create_task(service._validate_single_flight(cache_key, validator.validate, request_data))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(service._validate_single_flight(cache_key, validator.validate, request_data))
+    await asyncio.sleep(0)
+    validator.release.set()
+
+    with pytest.raises(RuntimeError):
+        await leader
+    result = await waiter
+
+    assert validator.calls == 2
+    assert result["call"] == 2
+    assert service._validation_result_cache.get(cache_key) is None
+    assert service._inflight_validations == {}
+
+@pytest.mark.asyncio
+async def test_cancelamento_de_quem_espera_nao_cancela_execucao(service, request_data):
+    """Testa que cancelar uma requisição em espera não interrompe a execução compartilhada."""
+    validator = _BlockingValidator()
+    cache_key = service._validation_cache_key(request_data.validation_type, request_data.client_identifier, request_data.data)
+
+    leader = asyncio.create_task(service._validate_single_flight(cache_key, validator.validate, request_data))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(service._validate_single_flight(cache_key, validator.validate, request_data))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    validator.release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    result = await leader
+
+    assert result["is_valid"] is True
+    assert validator.calls == 1
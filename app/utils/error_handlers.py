@@ -12,5 +12,5 @@ def handle_service_response_error(response: Dict[str, Any]):
     detail_message = response.get("message", "Ocorreu um erro inesperado no serviço.")
     status_code = response.get("status_code", status.HTTP_500_INTERNAL_SERVER_ERROR)
     
-    logger.error(f"Erro do serviço: [Código: {status_code}] - {detail_message}. Detalhes: {response.get('data', 'N/A')}")
+    logger.error("Erro do serviço: [Código: %s] - %s. Detalhes: %s", status_code, detail_message, response.get('data', 'N/A'))
     raise HTTPException(status_code=status_code, detail=detail_message)
\ No newline at end of file
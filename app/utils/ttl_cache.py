@@ -0,0 +1,48 @@
+# app/utils/ttl_cache.py
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class TTLCache:
+    """
+    Cache em memória (por processo) com tempo de expiração e tamanho máximo.
+
+    - Cada entrada expira 'ttl_seconds' após ser gravada.
+    - Ao atingir 'maxsize', a entrada usada há mais tempo (LRU) é descartada.
+    - Não é compartilhado entre workers: cada processo mantém o seu próprio cache.
+    """
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        # Mapeia chave -> (instante de expiração, valor), em ordem de uso (mais recente no final)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retorna o valor em cache para a chave, ou None se ausente ou expirado."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            # Entrada expirada: remove para liberar espaço
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Grava (ou substitui) o valor da chave, descartando a entrada LRU se o cache estiver cheio."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove todas as entradas do cache."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -3,7 +3,7 @@
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from typing import Dict, Any, List, Optional
 import uuid
@@ -158,6 +158,10 @@ async def lifespan(app: FastAPI):
 
     # Fase de SHUTDOWN
     logger.info("Fase de SHUTDOWN do Lifespan iniciada...")
+
+    # Grava os logs de auditoria ainda enfileirados antes de fechar o pool de conexões
+    if hasattr(app.state, 'validation_service'):
+        await app.state.validation_service.flush_logs()
     
     if hasattr(app.state, 'db_manager') and app.state.db_manager.is_connected:
         await app.state.db_manager.close()
@@ -170,13 +174,14 @@ app = FastAPI(
     title="Barramento de Validação de Dados",
     version="1.0.0",
     description="Uma API robusta para validar e enriquecer dados diversos.",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse # Respostas serializadas com orjson (mais rápido que o json da stdlib)
 )
 
 # --- Middleware de Autenticação API Key ---
 class APIKeyAuthMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
-        logger.debug(f"Requisição recebida no middleware para o caminho: {request.url.path} (de {request.client.host}:{request.client.port})")
+        logger.debug("Requisição recebida no middleware para o caminho: %s (de %s:%s)", request.url.path, request.client.host, request.client.port)
         
         # Rotas públicas que não requerem autenticação
         if request.url.path.startswith(("/docs", "/openapi.json", "/redoc", "/api/v1/health")): 
@@ -201,7 +206,22 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
         app_info: Dict[str, Any] = api_key_manager.get_app_info(api_key)
         
         if not app_info or not app_info.get("is_active"):
-            logger.warning(f"Tentativa de acesso com API Key inválida ou inativa: {api_key[:8]}...") 
+            api_key_prefix = api_key[:8] # Extraído uma única vez para o log e a auditoria
+            logger.warning("Tentativa de acesso com API Key inválida ou inativa: %s...", api_key_prefix)
+            # Log de auditoria da falha de autenticação, enfileirado sem bloquear a resposta
+            validation_service: Optional[ValidationService] = getattr(request.app.state, 'validation_service', None)
+            if validation_service:
+                validation_service.enqueue_log(
+                    LogEntry.model_construct(
+                        tipo_evento="AUTENTICACAO",
+                        app_origem=app_info.get("app_name", "Desconhecido") if app_info else "Desconhecido",
+                        usuario_operador="N/A",
+                        detalhes_evento_json={"api_key_prefix": api_key_prefix, "path": request.url.path, "status": "failed"},
+                        status_operacao="FALHA",
+                        mensagem_log="Tentativa de acesso com API Key inválida ou inativa.",
+                        client_entity_id_afetado=None
+                    )
+                )
             return JSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED, 
                 content={"detail": "API Key inválida ou não autorizada."}
@@ -212,13 +232,13 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
         request.state.can_delete_records = app_info.get("can_delete_records", False)
         request.state.can_check_duplicates = app_info.get("can_check_duplicates", False) 
         
-        logger.info(f"API Key '{request.state.auth_app_name}' autenticada com sucesso para o caminho '{request.url.path}'.")
+        logger.info("API Key '%s' autenticada com sucesso para o caminho '%s'.", request.state.auth_app_name, request.url.path)
 
         # Verifica permissões para operações específicas (soft-delete/restore)
         if request.url.path.startswith("/api/v1/records/soft-delete") or \
            request.url.path.startswith("/api/v1/records/restore"):
             if not request.state.can_delete_records:
-                logger.warning(f"Aplicação '{request.state.auth_app_name}' sem permissão para operação de delete/restore em {request.url.path}.")
+                logger.warning("Aplicação '%s' sem permissão para operação de delete/restore em %s.", request.state.auth_app_name, request.url.path)
                 return JSONResponse(
                     status_code=status.HTTP_403_FORBIDDEN,
                     content={"detail": "Permissão negada para esta operação. Sua API Key não tem privilégios para deletar/restaurar registros."}
@@ -231,7 +251,7 @@ app.add_middleware(APIKeyAuthMiddleware)
 # --- Manipuladores de Exceção Globais ---
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    logger.error(f"HTTP Exception em '{request.url.path}': {exc.status_code} - {exc.detail}")
+    logger.error("HTTP Exception em '%s': %s - %s", request.url.path, exc.status_code, exc.detail)
     
     log_repo = getattr(request.app.state, 'log_repo', None)
     app_name = getattr(request.state, 'auth_app_name', "Desconhecido")
@@ -257,7 +277,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
                 )
             )
         except Exception as log_exc:
-            logger.error(f"Falha ao registrar log de erro HTTP: {log_exc}", exc_info=True)
+            logger.error("Falha ao registrar log de erro HTTP: %s", log_exc, exc_info=True)
 
     return JSONResponse(
         status_code=exc.status_code,
@@ -267,7 +287,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     import traceback
-    logger.critical(f"Erro inesperado (Exceção Geral) em '{request.url.path}': {exc}", exc_info=True)
+    logger.critical("Erro inesperado (Exceção Geral) em '%s': %s", request.url.path, exc, exc_info=True)
     
     log_repo = getattr(request.app.state, 'log_repo', None)
     app_name = getattr(request.state, 'auth_app_name', "Desconhecido")
@@ -293,7 +313,7 @@ async def general_exception_handler(request: Request, exc: Exception):
                 )
             )
         except Exception as log_exc:
-            logger.error(f"Falha ao registrar log de erro fatal: {log_exc}", exc_info=True)
+            logger.error("Falha ao registrar log de erro fatal: %s", log_exc, exc_info=True)
 
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -320,11 +340,16 @@ app.include_router(validation_router, prefix="/api/v1")
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
     uvicorn.run(
         "main:app", # Referência alterada para main.py na raiz
         host="0.0.0.0", 
         port=8001, 
         reload=True,
+        # uvloop (event loop) e httptools (parser HTTP), fixados em requirements.txt;
+        # uvloop não existe no Windows (ver marcador em requirements.txt), onde fica o loop padrão do asyncio
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
         log_level=settings.LOG_LEVEL.lower() 
     )